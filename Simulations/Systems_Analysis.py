@@ -1,24 +1,146 @@
+import math
 import numpy as np
+from dataclasses import dataclass, fields
 from typing import Dict
 
+# Same optional-Numba shim as src/physics/_jit.py; the scripts here run
+# standalone, outside the src package, so they carry their own copy
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Core QDT Constants
+LAMBDA = 0.867    # Coupling constant
+GAMMA = 0.4497    # Damping coefficient
+BETA = 0.310      # Fractal recursion strength
+ETA = 0.520       # Energy transfer rate
+PHI = 1.6180      # Golden Ratio
+CMB_COUPLING = 3.67e-5  # CMB coupling constant
+
+# Physical Constants
+G = 6.674e-11     # Gravitational constant (Nm²/kg²)
+c = 2.998e8       # Speed of light (m/s)
+h = 6.626e-34     # Planck constant (Js)
+
+# Folded at import: r_s = SCHWARZSCHILD_COEFF * M, xi = XI_COEFF * r / M
+# (so r / r_s = xi / 2), E_cosmic ∝ COSMIC_COEFF * M / r,
+# E_quantum ∝ QUANTUM_COEFF / r
+SOLAR_MASS_KG = 2e30
+SCHWARZSCHILD_COEFF = 2 * G / c**2
+XI_COEFF = c**2 / G
+COSMIC_COEFF = LAMBDA * G
+QUANTUM_COEFF = h * c / BETA
+
+
+# No on-disk cache: this file is imported both as Systems_Analysis (from
+# inside Simulations/) and as Simulations.Systems_Analysis, and a cache
+# written under one name fails to load under the other.
+@njit(fastmath=True)
+def _calc_energies_core(M, r, spin):
+    """Scalar energy kernel for a single system (mass already in kg).
+
+    Module constants are read as globals, which Numba freezes into the
+    compiled code.
+
+    Returns (E_cosmic, E_quantum, E_emergence, E_total, r_s, xi).
+    """
+    r_s = SCHWARZSCHILD_COEFF * M
+    xi = XI_COEFF * r / M
+
+    # math.exp keeps the scalar path off NumPy's ufunc dispatch when Numba is
+    # unavailable; under Numba both lower to the same libm call.
+    damping = math.exp(-0.5 * GAMMA * xi)  # exp(-GAMMA*r/r_s), also |psi|^2
+    E_cosmic = COSMIC_COEFF * M / r * damping
+    E_quantum = QUANTUM_COEFF / r * damping
+    # 0.5 * (1 + tanh(x)) written as the logistic 1 / (1 + exp(-2x))
+    phase = 1.0 / (1.0 + math.exp(-ETA * BETA * spin * xi))
+    E_emergence = LAMBDA * E_cosmic * phase * math.exp(-BETA * xi)
+
+    return E_cosmic, E_quantum, E_emergence, E_cosmic + E_quantum + E_emergence, r_s, xi
+
+# Predefined systems, stored column-wise: mass (solar masses), radius (m), spin
+SYSTEM_NAMES = ("GRS_1915+105", "M87", "XTE_J1550-564")
+SYSTEM_PARAMS = np.array([
+    [12.4, 36.8e3, 0.98],
+    [6.5e9, 1.9e13, 0.90],
+    [9.1, 27.0e3, 0.95]
+])
+
+
+@dataclass(slots=True, frozen=True)
+class EnergyResult:
+    """Energy components and derived parameters.
+
+    Fields hold floats for a single system or arrays for a batch.
+    """
+    cosmic: float
+    quantum: float
+    emergence: float
+    total: float
+    quantum_cosmic: float
+    emergence_cosmic: float
+    schwarzschild_radius: float
+    scale_parameter: float
+
+    def select(self, index: int) -> "EnergyResult":
+        """Pick one system out of a batched result."""
+        return EnergyResult(*(getattr(self, f.name)[index].item() for f in fields(self)))
+
+
+@dataclass(slots=True, frozen=True)
+class Analysis:
+    """Full analysis of one system."""
+    system: str
+    energies: EnergyResult
+    cosmic_dominated: bool
+    quantum_suppressed: bool
+    emergence_bounded: bool
+
+    def to_dict(self) -> Dict:
+        """Nested dictionary form used for reporting and serialization."""
+        e = self.energies
+        return {
+            "system": self.system,
+            "energies": {
+                "cosmic": e.cosmic,
+                "quantum": e.quantum,
+                "emergence": e.emergence,
+                "total": e.total
+            },
+            "ratios": {
+                "quantum_cosmic": e.quantum_cosmic,
+                "emergence_cosmic": e.emergence_cosmic
+            },
+            "hierarchy": {
+                "cosmic_dominated": self.cosmic_dominated,
+                "quantum_suppressed": self.quantum_suppressed,
+                "emergence_bounded": self.emergence_bounded
+            },
+            "parameters": {
+                "schwarzschild_radius": e.schwarzschild_radius,
+                "scale_parameter": e.scale_parameter
+            }
+        }
+
+
 class QDTEnergyAnalyzer:
-    def __init__(self):
-        # Core QDT Constants
-        self.LAMBDA = 0.867    # Coupling constant
-        self.GAMMA = 0.4497    # Damping coefficient
-        self.BETA = 0.310      # Fractal recursion strength
-        self.ETA = 0.520       # Energy transfer rate
-        self.PHI = 1.6180      # Golden Ratio
-        self.CMB_COUPLING = 3.67e-5  # CMB coupling constant
-
-        # Physical Constants
-        self.G = 6.674e-11     # Gravitational constant (Nm²/kg²)
-        self.c = 2.998e8       # Speed of light (m/s)
-        self.h = 6.626e-34     # Planck constant (Js)
-
-    def calculate_energies(self, mass: float, radius: float, spin: float) -> Dict:
+    # The analyzer carries no per-instance state; constants live at module
+    # scope and are mirrored here for callers that read them as attributes.
+    __slots__ = ()
+
+    LAMBDA, GAMMA, BETA, ETA, PHI, CMB_COUPLING = LAMBDA, GAMMA, BETA, ETA, PHI, CMB_COUPLING
+    G, c, h = G, c, h
+
+    def calculate_energies(self, mass, radius, spin) -> EnergyResult:
         """
-        Calculate energy components for a system based on QDT.
+        Calculate energy components for one or more systems based on QDT.
+
+        All inputs may be scalars or equally shaped arrays; the computation
+        is broadcast so a whole batch of systems is evaluated in one pass.
 
         Args:
             mass: Mass in solar masses
@@ -26,51 +148,75 @@ class QDTEnergyAnalyzer:
             spin: Spin (dimensionless)
 
         Returns:
-            A dictionary containing energy components and derived parameters.
+            An EnergyResult with energy components and derived parameters.
         """
+        if np.ndim(mass) == np.ndim(radius) == np.ndim(spin) == 0:
+            return self._calculate_single(mass, radius, spin)
+
         # Convert mass to kilograms
-        M = mass * 2e30  # Solar masses to kg
-        r = radius
+        M = np.asarray(mass, dtype=float) * SOLAR_MASS_KG
+        r = np.asarray(radius, dtype=float)
+        spin = np.asarray(spin, dtype=float)
 
         # Characteristic Scales
-        r_s = 2 * self.G * M / self.c**2  # Schwarzschild radius
-        xi = r * self.c**2 / (self.G * M)  # Scale parameter
+        r_s = SCHWARZSCHILD_COEFF * M  # Schwarzschild radius
+        xi = XI_COEFF * r / M  # Scale parameter, equal to 2 * r / r_s
+
+        # Result buffers are allocated once and every chain below is
+        # evaluated in place to avoid temporaries on the batched path.
+        shape = np.broadcast_shapes(M.shape, r.shape, spin.shape)
+
+        # Shared damping term exp(-GAMMA*r/r_s). It is also |psi|^2 for the
+        # wave function psi = exp(-GAMMA*r/(2*r_s)), so the quantum density
+        # reuses it rather than evaluating another exponential.
+        damping = np.multiply(xi, -0.5 * GAMMA, out=np.empty(shape))
+        np.exp(damping, out=damping)
 
         # Cosmic Energy
-        E_cosmic = self.LAMBDA * (self.G * M / r) * np.exp(-self.GAMMA * (r / r_s))
+        E_cosmic = np.multiply(damping, COSMIC_COEFF * M / r, out=np.empty(shape))
 
         # Quantum Energy
-        psi = np.exp(-self.GAMMA * r / (2 * r_s))  # Wave function
-        E_quantum = (self.h * self.c / (r * self.BETA)) * abs(psi)**2
+        E_quantum = damping  # reuse the |psi|^2 buffer for the product
+        E_quantum *= QUANTUM_COEFF / r
 
         # Emergence Energy
-        phase = 0.5 * (1 + np.tanh(self.ETA * self.BETA * spin * (r / r_s)))
-        E_emergence = self.LAMBDA * E_cosmic * phase * np.exp(-self.BETA * xi)
+        # 0.5 * (1 + tanh(x)) is the logistic 1 / (1 + exp(-2x)); the exp
+        # form vectorizes where tanh does not and equals it up to rounding.
+        phase = np.multiply(-ETA * BETA * spin, xi, out=np.empty(shape))
+        np.exp(phase, out=phase)
+        phase += 1
+        np.reciprocal(phase, out=phase)
+        E_emergence = phase  # reuse the phase buffer for the product
+        E_emergence *= np.exp(-BETA * xi)
+        E_emergence *= E_cosmic
+        E_emergence *= LAMBDA
 
         # Total Energy
-        E_total = E_cosmic + E_quantum + E_emergence
+        E_total = np.add(E_cosmic, E_quantum, out=np.empty(shape))
+        E_total += E_emergence
 
         # Energy Ratios
-        ratios = {
-            "quantum_cosmic": E_quantum / E_cosmic if E_cosmic != 0 else 0,
-            "emergence_cosmic": E_emergence / E_cosmic if E_cosmic != 0 else 0
-        }
+        nonzero = E_cosmic != 0
+        quantum_cosmic = np.divide(E_quantum, E_cosmic, out=np.zeros_like(E_cosmic), where=nonzero)
+        emergence_cosmic = np.divide(E_emergence, E_cosmic, out=np.zeros_like(E_cosmic), where=nonzero)
 
-        return {
-            "energies": {
-                "cosmic": E_cosmic,
-                "quantum": E_quantum,
-                "emergence": E_emergence,
-                "total": E_total
-            },
-            "ratios": ratios,
-            "parameters": {
-                "schwarzschild_radius": r_s,
-                "scale_parameter": xi
-            }
-        }
+        return EnergyResult(E_cosmic, E_quantum, E_emergence, E_total,
+                            quantum_cosmic, emergence_cosmic, r_s, xi)
+
+    def _calculate_single(self, mass: float, radius: float, spin: float) -> EnergyResult:
+        """Scalar counterpart of calculate_energies backed by the compiled kernel."""
+        E_cosmic, E_quantum, E_emergence, E_total, r_s, xi = _calc_energies_core(
+            float(mass) * SOLAR_MASS_KG, float(radius), float(spin)
+        )
 
-    def analyze_system(self, name: str, mass: float, radius: float, spin: float) -> Dict:
+        return EnergyResult(
+            E_cosmic, E_quantum, E_emergence, E_total,
+            E_quantum / E_cosmic if E_cosmic != 0 else 0,
+            E_emergence / E_cosmic if E_cosmic != 0 else 0,
+            r_s, xi
+        )
+
+    def analyze_system(self, name: str, mass: float, radius: float, spin: float) -> Analysis:
         """
         Perform a full analysis for a given system.
 
@@ -81,45 +227,33 @@ class QDTEnergyAnalyzer:
             spin: Spin (dimensionless)
 
         Returns:
-            A dictionary containing the analysis results.
+            An Analysis with the energies and hierarchy checks.
         """
-        results = self.calculate_energies(mass, radius, spin)
-
-        # Conservation Error
-        component_sum = (results["energies"]["cosmic"] +
-                         results["energies"]["quantum"] +
-                         results["energies"]["emergence"])
-        conservation_error = abs(results["energies"]["total"] - component_sum) / component_sum
-
-        # Hierarchy Check
-        hierarchy = {
-            "cosmic_dominated": results["energies"]["cosmic"] > results["energies"]["emergence"],
-            "quantum_suppressed": results["energies"]["quantum"] < results["energies"]["cosmic"],
-            "emergence_bounded": results["energies"]["emergence"] < results["energies"]["cosmic"] * 10
-        }
-
-        return {
-            "system": name,
-            "energies": results["energies"],
-            "ratios": results["ratios"],
-            "conservation_error": conservation_error,
-            "hierarchy": hierarchy,
-            "parameters": results["parameters"]
-        }
+        return _analysis(name, self.calculate_energies(mass, radius, spin))
 
-    def analyze_all_systems(self) -> Dict:
+    def analyze_all_systems(self) -> Dict[str, Analysis]:
         """
         Analyze a set of predefined systems.
 
+        All systems are evaluated together in a single vectorized call.
+
         Returns:
-            A dictionary containing the analysis results for all systems.
+            A dictionary mapping system names to their Analysis.
         """
-        systems = {
-            "GRS_1915+105": (12.4, 36.8e3, 0.98),
-            "M87": (6.5e9, 1.9e13, 0.90),
-            "XTE_J1550-564": (9.1, 27.0e3, 0.95)
-        }
-        return {name: self.analyze_system(name, *params) for name, params in systems.items()}
+        mass, radius, spin = SYSTEM_PARAMS.T
+        batch = self.calculate_energies(mass, radius, spin)
+        return {name: _analysis(name, batch.select(i)) for i, name in enumerate(SYSTEM_NAMES)}
+
+
+def _analysis(name: str, energies: EnergyResult) -> Analysis:
+    """Attach the hierarchy checks to a single system's energies."""
+    return Analysis(
+        system=name,
+        energies=energies,
+        cosmic_dominated=energies.cosmic > energies.emergence,
+        quantum_suppressed=energies.quantum < energies.cosmic,
+        emergence_bounded=energies.emergence < energies.cosmic * 10
+    )
 
 # Example Execution
 if __name__ == "__main__":
@@ -127,7 +261,8 @@ if __name__ == "__main__":
     results = qdt_analyzer.analyze_all_systems()
 
     # Print Results
-    for system, result in results.items():
+    for system, analysis in results.items():
+        result = analysis.to_dict()
         print(f"\nSystem: {system}")
         print("Energy Components:")
         for key, value in result["energies"].items():
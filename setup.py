@@ -8,17 +8,24 @@ setup(
     install_requires=[
         "flask==2.0.1",
         "flask-cors==3.0.10",
+        "flask-compress==1.13",
         "flask-limiter==3.5.0",
         "flask-swagger-ui==4.11.1",
         "gunicorn==20.1.0",
         "numpy>=1.24.3",
         "scipy>=1.10.1",
+        "mpmath>=1.2.0",
+        "numba>=0.57.0",
         "python-dotenv>=0.19.0",
         "redis>=4.0.0",
-        "werkzeug<2.1.0",
-        "networkx>=2.6.0"
+        "orjson>=3.8.0",
+        "werkzeug<2.1.0"
     ],
-    python_requires=">=3.8",
+    extras_require={
+        # GMP-backed integers for the Lucas-Lehmer test (src/security/qdt_security.py)
+        "gmp": ["gmpy2>=2.1"]
+    },
+    python_requires=">=3.10",
     author="Quantum Duality Theory Team",
     author_email="team@quantumduality.com",
     description="A quantum duality theory implementation",
@@ -30,8 +37,6 @@ setup(
         "Intended Audience :: Science/Research",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
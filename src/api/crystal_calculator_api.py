@@ -2,22 +2,67 @@
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from flask_compress import Compress
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_swagger_ui import get_swaggerui_blueprint
 from physics.crystal_calculator import CrystalCalculator, CrystalCalculatorConfig
+from functools import lru_cache
 from typing import Dict, Any
+import numpy as np
+import orjson
+import redis
 import time
 import json
 import os
 from dotenv import load_dotenv
 
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:  # Flask < 2.2 has no pluggable JSON provider
+    DefaultJSONProvider = None
+
+try:
+    from flask.json import JSONEncoder as BaseJSONEncoder  # removed in Flask 2.3
+except ImportError:
+    from json import JSONEncoder as BaseJSONEncoder
+
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)
 
+if DefaultJSONProvider is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider that serializes with orjson, including NumPy values."""
+
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(
+                obj,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+class NumpyJSONEncoder(BaseJSONEncoder):
+    """JSON encoder for Flask < 2.2 that converts NumPy arrays and scalars."""
+
+    def default(self, o):
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        if isinstance(o, np.generic):
+            return o.item()
+        return super().default(o)
+
+if DefaultJSONProvider is None:
+    app.json_encoder = NumpyJSONEncoder
+
+Compress(app)  # gzip responses for clients that send Accept-Encoding
+
 # Production configurations
 app.config['PRODUCTION'] = os.getenv('FLASK_ENV') == 'production'
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-key-change-in-prod')
@@ -53,6 +98,49 @@ limiter = Limiter(
     storage_uri=app.config['REDIS_URL']
 )
 
+# Longest series accepted by /api/analyze
+MAX_SERIES_LENGTH = 10000
+
+# Cache for deterministic /api/calculate results, sharing the limiter's Redis
+CALCULATION_CACHE_TTL = 3600  # 1 hour
+try:
+    calculation_cache = redis.from_url(app.config['REDIS_URL'])
+except ValueError:
+    # Non-Redis storage URI (e.g. memory://); run without the result cache
+    calculation_cache = None
+
+def get_cached_calculation(key: str):
+    """Return cached response bytes for key, or None on a miss."""
+    if calculation_cache is None:
+        return None
+    try:
+        return calculation_cache.get(key)
+    except redis.RedisError as e:
+        app.logger.warning(f"Calculation cache unavailable: {str(e)}")
+        return None
+
+def cache_calculation(key: str, payload: bytes) -> None:
+    """Store response bytes for key; cache failures never fail the request."""
+    if calculation_cache is None:
+        return
+    try:
+        calculation_cache.setex(key, CALCULATION_CACHE_TTL, payload)
+    except redis.RedisError as e:
+        app.logger.warning(f"Calculation cache unavailable: {str(e)}")
+
+@lru_cache(maxsize=32)
+def get_calculator(evolution_steps: int = 100,
+                   convergence_threshold: float = 0.01,
+                   stability_window: int = 10,
+                   resonance_depth: int = 5) -> CrystalCalculator:
+    """Return a process-wide calculator for the given configuration."""
+    return CrystalCalculator(config=CrystalCalculatorConfig(
+        evolution_steps=evolution_steps,
+        convergence_threshold=convergence_threshold,
+        stability_window=stability_window,
+        resonance_depth=resonance_depth
+    ))
+
 def validate_request_data(data: Dict[str, Any], required_fields: list) -> tuple[bool, str]:
     """Validate request data contains required fields."""
     if not data or not isinstance(data, dict):
@@ -82,7 +170,7 @@ def health_check():
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get current calculator configuration."""
-    config = CrystalCalculatorConfig()
+    config = get_calculator().config
     return jsonify({
         'evolution_steps': config.evolution_steps,
         'convergence_threshold': config.convergence_threshold,
@@ -127,47 +215,62 @@ def calculate():
         if value <= 0:
             return jsonify(error="Value must be greater than 0"), 400
         
-        config = CrystalCalculatorConfig(
-            evolution_steps=evolution_steps,
-            convergence_threshold=0.01,
-            stability_window=10,
-            resonance_depth=5
-        )
+        # Add cache control headers
+        response_headers = {
+            'Cache-Control': f'public, max-age={CALCULATION_CACHE_TTL}',
+            'Vary': 'Accept-Encoding'
+        }
         
-        calculator = CrystalCalculator(config=config)
+        # Results are deterministic in (value, type, steps)
+        cache_key = f"calc:{value!r}:{calculation_type}:{evolution_steps}"
+        cached = get_cached_calculation(cache_key)
+        if cached is not None:
+            return app.response_class(
+                cached,
+                status=200,
+                headers=response_headers,
+                mimetype='application/json'
+            )
+        
+        calculator = get_calculator(evolution_steps=evolution_steps)
         result = calculator.calculate_crystal_enhanced_value(value, calculation_type)
         
-        # Ensure time series data is properly structured and optimized
+        # Series are passed through as-is; orjson serializes NumPy values
+        # natively so no per-element float() coercion is needed.
+        series = result['time_series']
         time_series = {
-            'void_energy': [float(x) for x in result['time_series']['void_energy']],
-            'filament_energy': [float(x) for x in result['time_series']['filament_energy']],
-            'emergence_energy': [float(x) for x in result['time_series']['emergence_energy']],
-            'crystal_phase': [float(x) for x in result['time_series']['crystal_phase']],
-            'resonance': [float(x) for x in result['time_series']['resonance']],
-            'steps': list(range(1, len(result['time_series']['void_energy']) + 1))
+            'void_energy': series['void'],
+            'filament_energy': series['filament'],
+            'emergence_energy': series['emergence'],
+            'crystal_phase': series['crystal_phase'],
+            'resonance': series['resonance'],
+            'steps': np.arange(1, len(series['void']) + 1)
         }
         
+        metrics = result['convergence_metrics']
         response = {
-            'void_energy': float(result['void_energy']),
-            'filament_energy': float(result['filament_energy']),
-            'emergence_energy': float(result['emergence_energy']),
-            'crystal_phase': float(result['crystal_phase']),
-            'resonance': float(result['resonance']),
+            'void_energy': result['void_energy'],
+            'filament_energy': result['filament_energy'],
+            'emergence_energy': result['emergence_energy'],
+            'crystal_phase': series['crystal_phase'][-1],
+            'resonance': series['resonance'][-1],
             'convergence_metrics': {
-                'stability_score': float(result['convergence_metrics']['stability_score']),
-                'phase_coherence': float(result['convergence_metrics']['phase_coherence']),
-                'convergence_rate': float(result['convergence_metrics']['convergence_rate'])
+                'stability_score': metrics['stability_score'],
+                'phase_coherence': metrics['phase_coherence'],
+                'convergence_rate': metrics['convergence_rate']
             },
             'time_series': time_series
         }
         
-        # Add cache control headers
-        response_headers = {
-            'Cache-Control': 'public, max-age=300',  # Cache for 5 minutes
-            'Vary': 'Accept-Encoding'
-        }
+        payload = orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY)
+        cache_calculation(cache_key, payload)
         
-        return jsonify(response), 200, response_headers
+        return app.response_class(
+            payload,
+            status=200,
+            headers=response_headers,
+            mimetype='application/json'
+        )
     except ValueError as e:
         app.logger.error(f"Value error in calculate: {str(e)}")
         return jsonify(error=f"Invalid input: {str(e)}"), 400
@@ -186,8 +289,15 @@ def analyze():
             return jsonify(error=error_msg), 400
         
         time_series = data['time_series']
+        if not isinstance(time_series, dict) or \
+                not all(isinstance(series, list) for series in time_series.values()):
+            return jsonify(error="time_series must map names to lists of values"), 400
+        
+        # Reject oversized payloads before any numerical work
+        if any(len(series) > MAX_SERIES_LENGTH for series in time_series.values()):
+            return jsonify(error=f"Each series may contain at most {MAX_SERIES_LENGTH} values"), 400
         
-        calculator = CrystalCalculator()
+        calculator = get_calculator()
         result = calculator.analyze_convergence_path(time_series)
         
         return jsonify(result)
@@ -212,23 +322,34 @@ def batch_calculate():
         if len(calculations) > 10:
             return jsonify(error="Maximum 10 calculations per batch"), 400
         
-        calculator = CrystalCalculator()
-        results = []
+        calculator = get_calculator()
+        results = [None] * len(calculations)
         
-        for calc in calculations:
+        # Validate every row first, then group the valid ones by type so each
+        # group is computed with a single batched calculator call
+        groups: Dict[str, list] = {}
+        for index, calc in enumerate(calculations):
             try:
                 valid, error_msg = validate_request_data(calc, ['value', 'calculation_type'])
                 if not valid:
-                    results.append({'error': error_msg})
+                    results[index] = {'error': error_msg}
                     continue
                 
-                result = calculator.calculate_crystal_enhanced_value(
-                    float(calc['value']), 
-                    calc['calculation_type']
-                )
-                results.append(result)
+                value = float(calc['value'])
+                groups.setdefault(calc['calculation_type'], []).append((index, value))
             except Exception as e:
-                results.append({'error': str(e)})
+                results[index] = {'error': str(e)}
+        
+        # Groups run inline: the evolution kernel holds the GIL, so a thread
+        # pool would only interleave them
+        for calculation_type, rows in groups.items():
+            indices, values = zip(*rows)
+            try:
+                batch = calculator.calculate_batch(np.array(values), calculation_type)
+            except Exception as e:
+                batch = [{'error': str(e)}] * len(indices)
+            for index, result in zip(indices, batch):
+                results[index] = result
         
         return jsonify({'results': results})
     except Exception as e:
@@ -251,21 +372,18 @@ def ask():
         if not isinstance(question, str) or len(question.strip()) < 3:
             return jsonify(error="Question must be at least 3 characters long"), 400
         
-        calculator = CrystalCalculator()
-        sample_result = calculator.calculate_crystal_enhanced_value(1.0, 'currency')
-        convergence_analysis = calculator.analyze_convergence_path(sample_result['time_series'])
-        
+        sample_result, sample_analysis, sample_confidence = get_sample_analysis()
         response = {
             'answer': generate_qdt_response(
                 question, 
                 sample_result, 
-                convergence_analysis
+                sample_analysis
             ),
-            'confidence': calculate_response_confidence(convergence_analysis),
+            'confidence': sample_confidence,
             'crystal_metrics': {
                 'phase_coherence': sample_result['convergence_metrics']['phase_coherence'],
                 'stability': sample_result['convergence_metrics']['stability_score'],
-                'resonance': convergence_analysis['crystal_resonance_coupling']
+                'resonance': sample_analysis['crystal_resonance_coupling']
             },
             'processing_time': time.time() - start_time
         }
@@ -275,6 +393,13 @@ def ask():
         app.logger.error(f"Error in ask: {str(e)}")
         return jsonify(error="Failed to process question"), 500
 
+# Keyword -> formatter for the question-specific part of an /api/ask answer
+QUESTION_INSIGHTS = (
+    ('convergence', lambda result: f"a convergence rate of {result['convergence_metrics']['convergence_rate']:.2%} per step."),
+    ('stability', lambda result: f"a crystal stability score of {result['convergence_metrics']['stability_score']:.2%}."),
+    ('energy', lambda result: f"void energy at {result['void_energy']:.2%} and filament energy at {result['filament_energy']:.2%}."),
+)
+
 def generate_qdt_response(question: str, 
                         calculation_result: dict, 
                         convergence_analysis: dict) -> str:
@@ -304,15 +429,12 @@ def generate_qdt_response(question: str,
     else:
         base_response += "the emerging patterns indicate "
     
-    # Question-specific responses
-    if "convergence" in question.lower():
-        return base_response + f"a convergence rate of {calculation_result['convergence_metrics']['convergence_rate']:.2%} per step."
-    elif "stability" in question.lower():
-        return base_response + f"a crystal stability score of {stability:.2%}."
-    elif "energy" in question.lower():
-        return base_response + f"void energy at {calculation_result['void_energy']:.2%} and filament energy at {calculation_result['filament_energy']:.2%}."
-    else:
-        return base_response + "a complex interplay of quantum duality factors affecting the system."
+    # Question-specific responses, first matching keyword wins
+    question = question.lower()
+    for keyword, format_insight in QUESTION_INSIGHTS:
+        if keyword in question:
+            return base_response + format_insight(calculation_result)
+    return base_response + "a complex interplay of quantum duality factors affecting the system."
 
 def calculate_response_confidence(convergence_analysis: dict) -> float:
     """Calculate confidence score for the response."""
@@ -322,6 +444,17 @@ def calculate_response_confidence(convergence_analysis: dict) -> float:
         (1 - abs(convergence_analysis['void_filament_coupling'])) * 0.3
     ))
 
+@lru_cache(maxsize=1)
+def get_sample_analysis() -> tuple:
+    """Reference (result, analysis, confidence) that /api/ask answers draw on.
+    
+    The calculation is fixed, so it runs once per process, on the first
+    question rather than at import.
+    """
+    result = get_calculator().calculate_crystal_enhanced_value(1.0, 'currency')
+    analysis = get_calculator().analyze_convergence_path(result['time_series'])
+    return result, analysis, calculate_response_confidence(analysis)
+
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=not app.config['PRODUCTION']) 
\ No newline at end of file
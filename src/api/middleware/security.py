@@ -1,27 +1,133 @@
-from functools import wraps
-from flask import request, jsonify
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from flask import g, request, jsonify
 from src.security.qdt_security import QDTSecurityCore, QDTAccessControl
-from src.security.monitoring import SecurityMonitor, SecurityAlert
+from src.security.monitoring import CounterAggregator, SecurityMonitor, SecurityAlert
+import hmac
+import logging
+import os
 import redis
+import threading
 import time
 
-# Initialize Redis client
-redis_client = redis.Redis(
+# Initialize Redis client on a bounded, shared connection pool; request
+# threads wait briefly for a free connection instead of opening new ones
+redis_pool = redis.BlockingConnectionPool(
     host='redis',
     port=6379,
     db=0,
-    decode_responses=True
+    decode_responses=True,
+    max_connections=64,
+    timeout=5
 )
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+class FlushingMonitor:
+    """Per-request front for SecurityMonitor.
+
+    Security events from the decorators (and from alerts sent through this
+    wrapper) are buffered in flask.g and flushed through one pipeline when
+    the outermost decorated call returns, so a request costs a single round
+    trip to Redis instead of one per monitoring call. Failure counters go
+    to a CounterAggregator shared by all requests.
+    """
+
+    def __init__(self, monitor: SecurityMonitor):
+        self.monitor = monitor
+        # Auth/hash failure counters are aggregated across requests and
+        # written in periodic batches rather than per request
+        self.counters = CounterAggregator(monitor)
+
+    def __getattr__(self, name):
+        # Anything not buffered (e.g. check_system_resources) goes straight through
+        return getattr(self.monitor, name)
+
+    def _buffer(self, op, *args):
+        ops = g.get('security_ops')
+        if ops is None:
+            # Outside a buffering() block, write immediately
+            self.monitor.flush([(op, args)])
+        else:
+            ops.append((op, args))
+
+    def log_security_event(self, event_type, details):
+        self._buffer('event', self.monitor.build_event(event_type, details))
+
+    def track_auth_attempt(self, user_key, success):
+        self.counters.track_auth_attempt(user_key, success)
+
+    def track_hash_validation(self, hash_value, valid):
+        self.counters.track_hash_validation(hash_value, valid)
+
+    @contextmanager
+    def buffering(self):
+        """Collect monitor calls until the outermost block exits"""
+        outermost = g.get('security_ops') is None
+        if outermost:
+            g.security_ops = []
+        try:
+            yield
+        finally:
+            if outermost:
+                ops = g.pop('security_ops')
+                self.monitor.flush(ops)
 
 # Initialize security components
 security_core = QDTSecurityCore()
 access_control = QDTAccessControl(security_core)
-security_monitor = SecurityMonitor(redis_client)
+security_monitor = FlushingMonitor(SecurityMonitor(redis_client))
 security_alert = SecurityAlert(security_monitor)
 
+# Resource metrics are sampled off the request path; requests read the latest
+# snapshot, which the sampler replaces wholesale (no lock needed)
+RESOURCE_SAMPLE_INTERVAL = 5  # seconds between samples
+_resource_snapshot = {'cpu_percent': 0.0, 'memory_percent': 0.0}
+_sampler_lock = threading.Lock()
+_sampler_pid = None  # process the sampler thread was started in
+
+def _sample_resources():
+    global _resource_snapshot
+    while True:
+        try:
+            _resource_snapshot = security_monitor.monitor.check_system_resources()
+        except Exception:
+            logging.getLogger(__name__).exception('Resource sampling failed')
+        time.sleep(RESOURCE_SAMPLE_INTERVAL)
+
+def _ensure_resource_sampler():
+    """Start the sampler on first use in each process.
+
+    Threads do not survive a fork, so a pre-forked worker starts its own
+    rather than relying on one started at import in the parent.
+    """
+    global _sampler_pid
+    if _sampler_pid == os.getpid():
+        return
+    with _sampler_lock:
+        if _sampler_pid != os.getpid():
+            threading.Thread(target=_sample_resources, name='resource-sampler', daemon=True).start()
+            _sampler_pid = os.getpid()
+
+@lru_cache(maxsize=1)
+def _expected_security_hash():
+    """The security hash depends only on the QDT constants, so build it once"""
+    return security_core._generate_security_hash()
+
+def _buffered(f):
+    """Run a decorated view with monitor writes batched into one pipeline"""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        with security_monitor.buffering():
+            return f(*args, **kwargs)
+    return wrapper
+
 def require_auth(level='PRIME_HUNTER'):
+    # Resolved once per decorated view; an unknown level fails at import
+    required_level = access_control.access_levels[level]
+    
     def decorator(f):
         @wraps(f)
+        @_buffered
         def decorated_function(*args, **kwargs):
             auth_header = request.headers.get('Authorization')
             if not auth_header:
@@ -39,10 +145,10 @@ def require_auth(level='PRIME_HUNTER'):
                 # Track authentication attempt
                 security_monitor.track_auth_attempt(
                     user_key,
-                    access_level >= access_control.access_levels[level]
+                    access_level >= required_level
                 )
                 
-                if access_level < access_control.access_levels[level]:
+                if access_level < required_level:
                     security_alert.send_alert(
                         'WARNING',
                         f'Failed access attempt for level {level} from {request.remote_addr}'
@@ -63,18 +169,18 @@ def require_auth(level='PRIME_HUNTER'):
 def validate_request():
     def decorator(f):
         @wraps(f)
+        @_buffered
         def decorated_function(*args, **kwargs):
-            # Validate request security hash
-            security_hash = request.headers.get('X-Security-Hash')
-            expected_hash = security_core._generate_security_hash()
+            # Validate request security hash; a missing header fails
+            # without consulting the expected hash at all
+            security_hash = request.headers.get('X-Security-Hash', '')
+            valid = bool(security_hash) and \
+                hmac.compare_digest(security_hash.encode(), _expected_security_hash().encode())
             
             # Track hash validation
-            security_monitor.track_hash_validation(
-                security_hash or '',
-                security_hash == expected_hash
-            )
+            security_monitor.track_hash_validation(security_hash, valid)
             
-            if not security_hash or security_hash != expected_hash:
+            if not valid:
                 security_alert.send_alert(
                     'WARNING',
                     f'Invalid security hash from {request.remote_addr}'
@@ -89,11 +195,13 @@ def monitor_request():
     """Middleware to monitor all requests"""
     def decorator(f):
         @wraps(f)
+        @_buffered
         def decorated_function(*args, **kwargs):
             start_time = time.time()
             
             # Check system resources before processing
-            metrics = security_monitor.check_system_resources()
+            _ensure_resource_sampler()
+            metrics = _resource_snapshot
             if metrics['cpu_percent'] > 90 or metrics['memory_percent'] > 90:
                 security_alert.send_alert(
                     'CRITICAL',
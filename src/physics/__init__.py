@@ -1,21 +1,32 @@
-"""Physics Package for Quantum Duality Theory."""
+"""Physics Package for Quantum Duality Theory.
 
-from .constants import QDTConstants
-from .cosmology_model import QDTCosmologyModel
-from .dark_energy import QDTDarkEnergyModel
-from .particle_physics_connections import ParticlePhysicsConnections
-from .hermetic_principles import HermeticQDT, ScaleLevel
-from .unity_principles import UnityPrinciples, UnityLevel
-from .quantum_gravity import QDTQuantumGravity
+Models are imported on first access (PEP 562), so importing one submodule,
+or the package itself, does not load every model.
+"""
 
-__all__ = [
-    'QDTConstants',
-    'QDTCosmologyModel',
-    'QDTDarkEnergyModel',
-    'QDTQuantumGravity',
-    'ParticlePhysicsConnections',
-    'HermeticQDT',
-    'ScaleLevel',
-    'UnityPrinciples',
-    'UnityLevel'
-] 
\ No newline at end of file
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'QDTConstants': 'constants',
+    'QDTCosmologyModel': 'cosmology_model',
+    'QDTDarkEnergyModel': 'dark_energy',
+    'ParticlePhysicsConnections': 'particle_physics_connections',
+    'HermeticQDT': 'hermetic_principles',
+    'ScaleLevel': 'hermetic_principles',
+    'UnityPrinciples': 'unity_principles',
+    'UnityLevel': 'unity_principles',
+    'QDTQuantumGravity': 'quantum_gravity'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value  # later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,20 @@
+"""Optional Numba support shared by the physics kernels.
+
+With Numba installed, njit and prange are Numba's; without it njit returns
+the function unchanged and prange is range, so kernels run as plain Python.
+
+Kernels are compiled without an on-disk cache (no cache=True): the physics
+modules are imported both as src.physics.* and (by the API) as physics.*,
+and a cache written under one name fails to load under the other.
+"""
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the kernels then run as plain Python
+    HAVE_NUMBA = False
+    prange = range
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
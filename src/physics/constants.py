@@ -15,7 +15,7 @@ Physical Reality:
 - Necessary simplifications of natural complexity
 """
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QDTConstants:
     """Constants bridging mathematical idealization and physical approximation.
     
@@ -25,6 +25,9 @@ class QDTConstants:
     
     The tension between these two aspects is not a flaw but a fundamental
     feature of how mathematics interfaces with physical reality.
+    
+    Instances are immutable and slotted, so hot loops can read them cheaply
+    and share one instance safely.
     """
     
     # Mathematical perfection meets physical approximation
@@ -34,4 +37,8 @@ class QDTConstants:
     ETA: float = 0.520    # Distribution parameter - perfect ratio, imperfect manifestation
     
     # The only truly mathematical constant
-    PHI: float = 1.618033988749  # Golden ratio - mathematically exact, physically approximated 
\ No newline at end of file
+    PHI: float = 1.618033988749  # Golden ratio - mathematically exact, physically approximated
+
+# Shared default instance; QDTConstants is immutable, so models can all use it.
+# (Slotted fields are not readable from the class itself.)
+DEFAULT_CONSTANTS = QDTConstants() 
\ No newline at end of file
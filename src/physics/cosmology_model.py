@@ -1,5 +1,8 @@
+import hashlib
+import json
+import logging
 import numpy as np # type: ignore
-from dataclasses import dataclass
+from dataclasses import asdict
 from typing import Dict, List, Tuple
 from .constants import QDTConstants
 
@@ -22,20 +25,6 @@ The challenge lies in bridging idealized mathematics with
 observable cosmic phenomena.
 """
 
-@dataclass
-class QDTConstants:
-    """Constants bridging mathematical idealization and cosmic reality.
-    
-    Each constant represents:
-    1. A mathematical abstraction in the equations
-    2. An approximation of complex cosmic phenomena
-    """
-    LAMBDA: float = 0.867    # Mathematical: coupling parameter / Physical: approximate void-filament ratio
-    GAMMA: float = 0.4497    # Mathematical: damping term / Physical: energy dissipation rate
-    BETA: float = 0.310      # Mathematical: recursion parameter / Physical: scale coupling strength
-    ETA: float = 0.520       # Mathematical: transfer coefficient / Physical: energy exchange rate
-    PHI: float = 1.618033988749  # Mathematical: exact / Physical: approximated in nature
-
 class QDTCosmologyModel:
     """Framework exploring cosmic evolution through mathematical and physical lenses.
     
@@ -45,7 +34,15 @@ class QDTCosmologyModel:
     3. Finite vs Infinite: Bounded universe meets unbounded equations
     """
 
-    def __init__(self):
+    PREDICTION_CACHE_TTL = 60  # seconds
+
+    def __init__(self, cache=None):
+        """Set up the model.
+        
+        cache is an optional Redis-style client (get/setex) used to memoize
+        predict_future_evolution across calls and processes.
+        """
+        self.cache = cache
         self.constants = QDTConstants()
         # Mathematical idealization meets observational reality
         self.cosmological_parameters = {
@@ -56,7 +53,8 @@ class QDTCosmologyModel:
             'n_s': 0.965  # Spectral index - mathematical point, physical range
         }
 
-    def calculate_qdt_cosmological_evolution(self, z_range: Tuple[float, float], n_points: int = 1000) -> List[Dict]:
+    def calculate_qdt_cosmological_evolution(self, z_range: Tuple[float, float], n_points: int = 1000,
+                                             spacing: str = 'log') -> List[Dict]:
         """Study cosmic evolution at the mathematics-physics interface.
         
         Mathematical Framework:
@@ -68,47 +66,50 @@ class QDTCosmologyModel:
         - Quantum fluctuations
         - Broken symmetries
         - Discrete structures
+        
+        z_range holds the lowest and highest redshift. With spacing='log' the
+        points are geometrically spaced (a zero lower bound starts at 1e-3);
+        spacing='linear' spaces them evenly.
         """
-        redshifts = np.logspace(z_range[0], z_range[1], n_points)
-        evolution_data = []
+        z_lo, z_hi = z_range
+        if spacing == 'log':
+            redshifts = np.geomspace(max(z_lo, 1e-3), z_hi, n_points)
+        elif spacing == 'linear':
+            redshifts = np.linspace(z_lo, z_hi, n_points)
+        else:
+            raise ValueError(f"Unknown spacing: {spacing}")
         
-        for z in redshifts:
-            # Scale factor
-            a = 1 / (1 + z)
-            
-            # Time since big bang
-            t = self._lookback_time(z)
-            
-            # QDT time mediation at cosmological scale
-            kappa_cosmo = np.exp(-self.constants.GAMMA * t / 13.8) * \
-                         np.sin(2 * np.pi * t * self.constants.ETA / 13.8)
-            
-            # Void-filament energy densities
-            rho_void = self._calculate_void_density(z, kappa_cosmo)
-            rho_filament = self._calculate_filament_density(z, kappa_cosmo)
-            
-            # Total dark energy density
-            rho_de = rho_void + rho_filament
-            
-            # Equation of state parameter
-            w_de = self._calculate_equation_of_state(rho_void, rho_filament)
-            
-            evolution_data.append({
-                'redshift': z,
-                'scale_factor': a,
-                'lookback_time': t,
-                'kappa': kappa_cosmo,
-                'void_density': rho_void,
-                'filament_density': rho_filament,
-                'dark_energy_density': rho_de,
-                'equation_of_state': w_de
-            })
+        # Every quantity is evaluated over the whole redshift grid at once
+        # Scale factor, shared by all helpers below
+        a = 1 / (1 + redshifts)
+        
+        # Time since big bang
+        t = self._lookback_time(a)
+        
+        # QDT time mediation at cosmological scale
+        kappa_cosmo = np.exp(-self.constants.GAMMA * t / 13.8) * \
+                     np.sin(2 * np.pi * t * self.constants.ETA / 13.8)
         
-        return evolution_data
+        # Void-filament energy densities
+        rho_void = self._calculate_void_density(a, kappa_cosmo)
+        rho_filament = self._calculate_filament_density(a, kappa_cosmo)
+        
+        # Total dark energy density
+        rho_de = rho_void + rho_filament
+        
+        # Equation of state parameter
+        w_de = self._calculate_equation_of_state(rho_void, rho_filament)
+        
+        keys = ('redshift', 'scale_factor', 'lookback_time', 'kappa', 'void_density',
+                'filament_density', 'dark_energy_density', 'equation_of_state')
+        columns = (redshifts, a, t, kappa_cosmo, rho_void, rho_filament, rho_de, w_de)
+        return [dict(zip(keys, row)) for row in zip(*columns)]
 
-    def _lookback_time(self, z: float) -> float:
+    def _lookback_time(self, a):
         """Calculate lookback time where mathematical time meets physical measurement.
         
+        Takes the scale factor a = 1/(1+z), as a scalar or an array.
+        
         Mathematical Domain:
         - Perfect integration
         - Exact metric
@@ -131,14 +132,16 @@ class QDTCosmologyModel:
         age_universe = t_H * 2/3 / np.sqrt(Omega_Lambda)
         
         # Lookback time
-        a = 1 / (1 + z)
-        lookback = age_universe * (1 - a**(3/2))
+        lookback = age_universe * (1 - a * np.sqrt(a))  # a**(3/2) without a general pow
         
         return lookback
 
-    def _calculate_void_density(self, z: float, kappa: float) -> float:
+    def _calculate_void_density(self, a, kappa):
         """Study void energy where mathematical continuity meets quantum discreteness.
         
+        Takes the scale factor a = 1/(1+z) and kappa as scalars or
+        equally shaped arrays.
+        
         Mathematical Model:
         - Continuous density field
         - Perfect scaling laws
@@ -149,8 +152,6 @@ class QDTCosmologyModel:
         - Scale-dependent effects
         - Measurement limits
         """
-        a = 1 / (1 + z)
-        
         # Void energy evolves differently than matter/radiation
         rho_void = self.constants.LAMBDA * \
                    self.cosmological_parameters['Omega_Lambda'] * \
@@ -158,9 +159,12 @@ class QDTCosmologyModel:
         
         return rho_void
 
-    def _calculate_filament_density(self, z: float, kappa: float) -> float:
+    def _calculate_filament_density(self, a, kappa):
         """Analyze filament energy bridging mathematical and physical descriptions.
         
+        Takes the scale factor a = 1/(1+z) and kappa as scalars or
+        equally shaped arrays.
+        
         Mathematical Framework:
         - Perfect network model
         - Exact energy distribution
@@ -171,8 +175,6 @@ class QDTCosmologyModel:
         - Energy fluctuations
         - Scale coupling
         """
-        a = 1 / (1 + z)
-        
         # Filament energy decreases with expansion
         rho_filament = (1 - self.constants.LAMBDA) * \
                       self.cosmological_parameters['Omega_Lambda'] * \
@@ -180,9 +182,11 @@ class QDTCosmologyModel:
         
         return rho_filament
 
-    def _calculate_equation_of_state(self, rho_void: float, rho_filament: float) -> float:
+    def _calculate_equation_of_state(self, rho_void, rho_filament):
         """Derive equation of state balancing mathematical elegance with physical reality.
         
+        Accepts scalars or equally shaped arrays; a zero total density gives -1.
+        
         Mathematical Beauty:
         - Perfect fluid description
         - Exact state equation
@@ -193,18 +197,16 @@ class QDTCosmologyModel:
         - State variations
         - Parameter uncertainty
         """
-        total_rho = rho_void + rho_filament
-        
-        if total_rho == 0:
-            return -1
+        total_rho = np.asarray(rho_void + rho_filament, dtype=float)
         
         # Void contributes w = -1, filament contributes w > -1
         w_void = -1
         w_filament = -0.5  # Phantom energy component
         
-        w_effective = (rho_void * w_void + rho_filament * w_filament) / total_rho
+        w_effective = np.divide(rho_void * w_void + rho_filament * w_filament, total_rho,
+                                out=np.full_like(total_rho, -1.0), where=total_rho != 0)
         
-        return w_effective
+        return w_effective if w_effective.ndim else w_effective[()]
 
     def predict_future_evolution(self, time_horizon_gyr: float = 50) -> List[Dict]:
         """Explore future evolution acknowledging mathematical certainty and physical uncertainty.
@@ -222,9 +224,21 @@ class QDTCosmologyModel:
         The tension between mathematical prediction and physical reality
         grows larger as we extrapolate further into the future.
         """
+        cache_key = self._prediction_cache_key(time_horizon_gyr)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         current_age = 13.8  # Gyr
         future_times = np.linspace(current_age, current_age + time_horizon_gyr, 100)
         
+        # Bind constants and parameters once for the loop below
+        LAMBDA, GAMMA, BETA, ETA = (self.constants.LAMBDA, self.constants.GAMMA,
+                                    self.constants.BETA, self.constants.ETA)
+        H0 = self.cosmological_parameters['H0']
+        Omega_m = self.cosmological_parameters['Omega_m']
+        Omega_Lambda = self.cosmological_parameters['Omega_Lambda']
+        
         future_evolution = []
         
         for t in future_times:
@@ -232,12 +246,12 @@ class QDTCosmologyModel:
             z = max(0, (current_age / t)**(2/3) - 1)
             
             # QDT evolution
-            kappa = np.exp(-self.constants.GAMMA * t / current_age) * \
-                   np.sin(2 * np.pi * t * self.constants.ETA / current_age)
+            kappa = np.exp(-GAMMA * t / current_age) * \
+                   np.sin(2 * np.pi * t * ETA / current_age)
             
             # Future void-filament balance
-            void_fraction = self.constants.LAMBDA * (1 + kappa * 0.05)
-            filament_fraction = (1 - self.constants.LAMBDA) * (1 - kappa * 0.05)
+            void_fraction = LAMBDA * (1 + kappa * 0.05)
+            filament_fraction = (1 - LAMBDA) * (1 - kappa * 0.05)
             
             # Renormalize
             total = void_fraction + filament_fraction
@@ -245,11 +259,11 @@ class QDTCosmologyModel:
             filament_fraction /= total
             
             # Hubble parameter evolution
-            H_t = self.cosmological_parameters['H0'] * np.sqrt(
-                self.cosmological_parameters['Omega_m'] * (1 + z)**3 +
-                self.cosmological_parameters['Omega_Lambda'] * 
-                (void_fraction * (1 + z)**(-3 * self.constants.BETA) +
-                 filament_fraction * (1 + z)**(-3 * (1 - self.constants.BETA)))
+            H_t = H0 * np.sqrt(
+                Omega_m * (1 + z)**3 +
+                Omega_Lambda * 
+                (void_fraction * (1 + z)**(-3 * BETA) +
+                 filament_fraction * (1 + z)**(-3 * (1 - BETA)))
             )
             
             future_evolution.append({
@@ -261,4 +275,28 @@ class QDTCosmologyModel:
                 'universe_age_ratio': t / current_age
             })
         
-        return future_evolution 
\ No newline at end of file
+        self._cache_set(cache_key, future_evolution)
+        return future_evolution
+
+    def _prediction_cache_key(self, time_horizon_gyr: float) -> str:
+        """Key a prediction by everything it depends on."""
+        state = (sorted(self.cosmological_parameters.items()), asdict(self.constants), time_horizon_gyr)
+        return 'qdt:predict:' + hashlib.blake2b(repr(state).encode()).hexdigest()
+
+    def _cache_get(self, key: str):
+        if self.cache is None:
+            return None
+        try:
+            cached = self.cache.get(key)
+        except Exception:  # an unavailable cache must not break the model
+            logging.getLogger(__name__).warning('Prediction cache read failed', exc_info=True)
+            return None
+        return json.loads(cached) if cached is not None else None
+
+    def _cache_set(self, key: str, value) -> None:
+        if self.cache is None:
+            return
+        try:
+            self.cache.setex(key, self.PREDICTION_CACHE_TTL, json.dumps(value))
+        except Exception:
+            logging.getLogger(__name__).warning('Prediction cache write failed', exc_info=True) 
\ No newline at end of file
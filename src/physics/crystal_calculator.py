@@ -14,16 +14,121 @@ Physical Reality:
 - Complex interactions
 """
 
+import math
 import numpy as np
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
 from .time_crystal import TimeCrystalOscillator, TimeCrystalParameters
 from .constants import QDTConstants
+from ._jit import njit
+
+def _sieve_primes(count: int) -> np.ndarray:
+    """First `count` primes by a sieve of Eratosthenes."""
+    # Rosser's bound n(ln n + ln ln n) on the nth prime holds for n >= 6
+    limit = 11
+    if count >= 6:
+        limit = int(count * (np.log(count) + np.log(np.log(count)))) + 1
+    is_prime = np.ones(limit + 1, dtype=bool)
+    is_prime[:2] = False
+    for i in range(2, int(limit ** 0.5) + 1):
+        if is_prime[i]:
+            is_prime[i * i::i] = False
+    return np.flatnonzero(is_prime)[:count]
+
+# Enough primes for any practical resonance depth; deeper requests re-sieve
+_PRIMES = _sieve_primes(1024)
+
+def _first_primes(count: int) -> np.ndarray:
+    """First `count` primes, served from the precomputed table when possible."""
+    return _PRIMES[:count] if count <= len(_PRIMES) else _sieve_primes(count)
+
+@njit(fastmath=True)
+def _crystal_evolution_core(t, crystal_mod, crystal_phase, primes,
+                            LAMBDA, GAMMA, BETA, ETA, PHI, window, threshold):
+    """Per-step crystal evolution kernel.
+
+    Crystal modulation and phase are precomputed by the oscillator; the
+    constants are passed as plain floats so the kernel compiles without
+    Python objects.
+
+    Returns (void, filament, emergence, resonance, convergence, history)
+    arrays, where history is the mean convergence over the trailing
+    `window` steps (fewer during warm-up), followed by the number of steps
+    actually evolved. Once a full window's mean drops below `threshold` the
+    evolution has settled: the loop stops and the remaining steps hold the
+    last computed values. The caller pads crystal_phase the same way so
+    convergence stays |crystal_phase - resonance| at every step.
+    """
+    n = t.shape[0]
+    void = np.empty(n)
+    filament = np.empty(n)
+    emergence = np.empty(n)
+    resonance = np.empty(n)
+    convergence = np.empty(n)
+    history = np.empty(n)
+
+    # Ring buffer with a running sum keeps the window mean O(1) per step
+    ring = np.zeros(window)
+    running_sum = 0.0
+
+    steps = n
+    for i in range(n):
+        ti = t[i]
+        gain = 1.0 + 0.1 * crystal_mod[i]
+
+        # Base void energy with crystal coupling
+        v = math.exp(-GAMMA * ti) * (1.0 / max(1.0, ti)) ** BETA * gain
+
+        # Emergence energy with crystal stability
+        e = ETA * (1.0 - math.exp(-0.1 * ti)) * math.sin(math.pi * ti * PHI) * \
+            LAMBDA * GAMMA * (1.0 + 0.05 * crystal_mod[i])
+
+        # Prime resonances with crystal phase, normalized by their magnitude
+        res_sum = 0.0
+        res_abs = 0.0
+        for p in primes:
+            r = math.sin(2 * math.pi * p * LAMBDA * ti) * math.cos(math.pi * p * BETA * ti) * gain
+            res_sum += r
+            res_abs += abs(r)
+        res = res_sum / res_abs if res_abs > 0 else 0.0
+
+        # Filament energy with crystal-enhanced coupling
+        f = LAMBDA * (1.0 - v) + res * (v + e) / 2 * gain
+
+        # Normalize energies
+        scale = 1.0 / (v + f + e)
+        void[i] = v * scale
+        filament[i] = f * scale
+        emergence[i] = e * scale
+        resonance[i] = res
+        convergence[i] = abs(crystal_phase[i] - res)
+
+        # Update stability window
+        slot = i % window
+        running_sum += convergence[i] - ring[slot]
+        ring[slot] = convergence[i]
+        history[i] = running_sum / min(i + 1, window)
+
+        if i + 1 >= window and history[i] < threshold:
+            void[i + 1:] = void[i]
+            filament[i + 1:] = filament[i]
+            emergence[i + 1:] = emergence[i]
+            resonance[i + 1:] = resonance[i]
+            convergence[i + 1:] = convergence[i]
+            history[i + 1:] = history[i]
+            steps = i + 1
+            break
+
+    return void, filament, emergence, resonance, convergence, history, steps
 
 @dataclass
 class CrystalCalculatorConfig:
     """Configuration for crystal-enhanced calculations."""
     evolution_steps: int = 100
+    # Stop evolving once the window mean falls below this; later steps then
+    # repeat the last state, so a larger threshold changes the final values.
+    # 0 always runs every step.
     convergence_threshold: float = 0.01
     stability_window: int = 10
     resonance_depth: int = 5
@@ -31,6 +136,16 @@ class CrystalCalculatorConfig:
 class CrystalCalculator:
     """Integrates time crystal dynamics with QDT value calculations."""
     
+    # Type-specific multipliers, built once and read-only
+    TYPE_MULTIPLIERS = MappingProxyType({
+        'currency': 0.867,
+        'human_life': 1.618,
+        'natural_resource': 1.414,
+        'crypto': 0.618,
+        'art': 1.732,
+        'radioactive_potato': np.pi
+    })
+    
     def __init__(self, 
                  config: Optional[CrystalCalculatorConfig] = None,
                  crystal_params: Optional[TimeCrystalParameters] = None):
@@ -54,104 +169,82 @@ class CrystalCalculator:
         - Type ambiguity
         - Complex dynamics
         """
-        # Type-specific multipliers
-        type_multipliers = {
-            'currency': 0.867,
-            'human_life': 1.618,
-            'natural_resource': 1.414,
-            'crypto': 0.618,
-            'art': 1.732,
-            'radioactive_potato': np.pi
+        # Scale the input once; the evolution itself is value-independent
+        scaled_value = value * self._get_multiplier(calculation_type)
+        evolution = self._run_evolution()
+        
+        # Calculate final QDT value
+        qdt_value = scaled_value * evolution['weighted_energy']
+        
+        return {
+            'original_value': value,
+            'qdt_value': qdt_value,
+            **evolution['result']
         }
-        multiplier = type_multipliers.get(calculation_type, 1.0)
+
+    def calculate_batch(self, 
+                        values: np.ndarray, 
+                        calculation_type: str) -> List[Dict]:
+        """Calculate crystal-enhanced values for many inputs of one type.
+        
+        The crystal evolution does not depend on the input value, so it is
+        run once and the QDT value is broadcast over all inputs.
+        """
+        values = np.asarray(values, dtype=float)
+        scaled_values = values * self._get_multiplier(calculation_type)
+        evolution = self._run_evolution()
         
-        # Initialize evolution tracking
+        qdt_values = scaled_values * evolution['weighted_energy']
+        
+        return [
+            {'original_value': value, 'qdt_value': qdt_value, **evolution['result']}
+            for value, qdt_value in zip(values.tolist(), qdt_values.tolist())
+        ]
+
+    def _get_multiplier(self, calculation_type: str) -> float:
+        """Get the type-specific value multiplier."""
+        return self.TYPE_MULTIPLIERS.get(calculation_type, 1.0)
+
+    def _run_evolution(self) -> Dict:
+        """Run the value-independent crystal evolution.
+        
+        Returns the weighted final energy used to scale input values and the
+        shared part of the calculation result.
+        """
+        t = np.linspace(0, 10, self.config.evolution_steps)
+        
+        # Crystal modulation and phase over the whole time grid
+        crystal_mod = self.crystal.time_crystal_modulation(t)
+        crystal_phase = self.crystal.time_crystal_oscillation(t)
+        
+        (void_energy, filament_energy, emergence_energy,
+         normalized_resonance, convergence, convergence_history, steps) = _crystal_evolution_core(
+            t, crystal_mod, crystal_phase,
+            _first_primes(self.config.resonance_depth),
+            self.constants.LAMBDA, self.constants.GAMMA, self.constants.BETA,
+            self.constants.ETA, self.constants.PHI,
+            self.config.stability_window, self.config.convergence_threshold
+        )
+        
+        # After an early stop the phase is held too, like every other series
+        crystal_phase[steps:] = crystal_phase[steps - 1]
+        
+        # Channels are kept as contiguous float64 arrays for downstream analysis
         time_series = {
-            'void': [],
-            'filament': [],
-            'emergence': [],
-            'resonance': [],
-            'crystal_phase': [],
-            'convergence': []
+            'void': void_energy,
+            'filament': filament_energy,
+            'emergence': emergence_energy,
+            'resonance': normalized_resonance,
+            'crystal_phase': crystal_phase,
+            'convergence': convergence
         }
         
-        # Generate time steps
-        time_steps = np.linspace(0, 10, self.config.evolution_steps)
-        
-        # Track convergence metrics
-        convergence_history = []
-        stability_window = []
-        
-        for t in time_steps:
-            # Calculate crystal modulation
-            crystal_mod = self.crystal.time_crystal_modulation(t)
-            
-            # Base void energy with crystal coupling
-            void_energy = np.exp(-self.constants.GAMMA * t) * \
-                         (1/np.max([1, t]))**self.constants.BETA * \
-                         (1 + 0.1 * crystal_mod)
-            
-            # Emergence energy with crystal stability
-            emergence_energy = self.constants.ETA * \
-                             (1 - np.exp(-0.1 * t)) * \
-                             np.sin(np.pi * t * self.constants.PHI) * \
-                             self.constants.LAMBDA * \
-                             self.constants.GAMMA * \
-                             (1 + 0.05 * crystal_mod)
-            
-            # Calculate prime resonances with crystal phase
-            resonances = []
-            for i in range(self.config.resonance_depth):
-                p = self._get_prime(i)
-                resonance = np.sin(2 * np.pi * p * self.constants.LAMBDA * t) * \
-                           np.cos(np.pi * p * self.constants.BETA * t) * \
-                           (1 + 0.1 * crystal_mod)
-                resonances.append(resonance)
-            
-            # Normalize resonances
-            total_resonance = np.sum(np.abs(resonances))
-            if total_resonance > 0:
-                normalized_resonance = np.sum(resonances) / total_resonance
-            else:
-                normalized_resonance = 0
-            
-            # Filament energy with crystal-enhanced coupling
-            filament_energy = self.constants.LAMBDA * (1 - void_energy) + \
-                            normalized_resonance * \
-                            (void_energy + emergence_energy)/2 * \
-                            (1 + 0.1 * crystal_mod)
-            
-            # Normalize energies
-            total = void_energy + filament_energy + emergence_energy
-            void_energy /= total
-            filament_energy /= total
-            emergence_energy /= total
-            
-            # Calculate convergence metric
-            crystal_phase = self.crystal.time_crystal_oscillation(t)
-            convergence = np.abs(crystal_phase - normalized_resonance)
-            
-            # Update stability window
-            stability_window.append(convergence)
-            if len(stability_window) > self.config.stability_window:
-                stability_window.pop(0)
-            
-            # Track metrics
-            time_series['void'].append(void_energy)
-            time_series['filament'].append(filament_energy)
-            time_series['emergence'].append(emergence_energy)
-            time_series['resonance'].append(normalized_resonance)
-            time_series['crystal_phase'].append(crystal_phase)
-            time_series['convergence'].append(convergence)
-            
-            convergence_history.append(np.mean(stability_window))
-        
-        # Calculate final QDT value
+        # Weighted final energy
         final_void = time_series['void'][-1]
         final_filament = time_series['filament'][-1]
         final_emergence = time_series['emergence'][-1]
         
-        qdt_value = value * multiplier * (
+        weighted_energy = (
             final_void * 0.4 + 
             final_filament * 0.4 + 
             final_emergence * 0.2
@@ -169,30 +262,25 @@ class CrystalCalculator:
         )
         
         return {
-            'original_value': value,
-            'qdt_value': qdt_value,
-            'void_energy': final_void,
-            'filament_energy': final_filament,
-            'emergence_energy': final_emergence,
-            'time_series': time_series,
-            'convergence_metrics': {
-                'stability_score': stability_score,
-                'convergence_rate': convergence_rate,
-                'final_convergence': final_convergence,
-                'phase_coherence': crystal_stability['phase_coherence'],
-                'amplitude_stability': crystal_stability['amplitude_stability']
+            'weighted_energy': weighted_energy,
+            'result': {
+                'void_energy': final_void,
+                'filament_energy': final_filament,
+                'emergence_energy': final_emergence,
+                'time_series': time_series,
+                'convergence_metrics': {
+                    'stability_score': stability_score,
+                    'convergence_rate': convergence_rate,
+                    'final_convergence': final_convergence,
+                    'phase_coherence': crystal_stability['phase_coherence'],
+                    'amplitude_stability': crystal_stability['amplitude_stability']
+                }
             }
         }
 
     def _get_prime(self, n: int) -> int:
         """Get nth prime number."""
-        primes = []
-        num = 2
-        while len(primes) <= n:
-            if all(num % prime != 0 for prime in primes):
-                primes.append(num)
-            num += 1
-        return primes[-1]
+        return int(_first_primes(n + 1)[n])
 
     def analyze_convergence_path(self, 
                                time_series: Dict[str, List[float]]) -> Dict:
@@ -208,29 +296,25 @@ class CrystalCalculator:
         - Metric fluctuations
         - Complex phase dynamics
         """
-        # Calculate phase space metrics
-        void_filament_coupling = np.corrcoef(
-            time_series['void'], 
-            time_series['filament']
-        )[0, 1]
-        
-        crystal_resonance_coupling = np.corrcoef(
-            time_series['crystal_phase'], 
+        # One correlation matrix over all channels serves every coupling
+        # metric: rows are void, filament, emergence, crystal_phase, resonance
+        correlations = np.corrcoef(np.vstack([
+            time_series['void'],
+            time_series['filament'],
+            time_series['emergence'],
+            time_series['crystal_phase'],
             time_series['resonance']
-        )[0, 1]
+        ]))
+        
+        # Calculate phase space metrics
+        void_filament_coupling = correlations[0, 1]
+        crystal_resonance_coupling = correlations[3, 4]
         
         # Analyze convergence stability
         convergence_stability = 1 - np.std(time_series['convergence'])
         
-        # Calculate effective dimensionality
-        components = [
-            time_series['void'],
-            time_series['filament'],
-            time_series['emergence'],
-            time_series['crystal_phase']
-        ]
-        correlations = np.corrcoef(components)
-        eigenvalues = np.linalg.eigvals(correlations)
+        # Calculate effective dimensionality from the symmetric 4x4 block
+        eigenvalues = np.linalg.eigvalsh(correlations[:4, :4])
         effective_dim = np.sum(eigenvalues > 0.1)  # 10% threshold
         
         return {
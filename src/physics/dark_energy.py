@@ -1,6 +1,10 @@
 import numpy as np # type: ignore
-from typing import Dict, List, Tuple
-from .constants import QDTConstants
+from collections.abc import Mapping as MappingABC
+from dataclasses import asdict, dataclass
+from numpy.typing import ArrayLike # type: ignore
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+from .constants import DEFAULT_CONSTANTS
 
 """Dark Energy QDT Module
 
@@ -22,6 +26,106 @@ The framework acknowledges both the mathematical elegance we seek
 and the physical mysteries we face.
 """
 
+# Descriptive summaries are fixed, so they are built once as read-only views
+_DARK_ENERGY_MODEL = MappingProxyType({
+    'mathematical_structure': MappingProxyType({
+        'equations': 'Perfect mathematical form',
+        'symmetries': 'Exact theoretical invariance',
+        'parameters': 'Precise numerical values'
+    }),
+    'physical_reality': MappingProxyType({
+        'nature': 'Fundamentally mysterious',
+        'measurements': 'Limited by observation',
+        'quantum_effects': 'Poorly understood'
+    }),
+    'theoretical_tension': MappingProxyType({
+        'elegance': 'Mathematical beauty suggests truth',
+        'mystery': 'Physical nature remains elusive',
+        'reconciliation': 'Seeking bridge between form and substance'
+    })
+})
+
+_PARTICLE_PHYSICS_CONNECTIONS = MappingProxyType({
+    'mathematical_framework': MappingProxyType({
+        'fields': 'Perfect quantum field theory',
+        'symmetries': 'Exact gauge invariance',
+        'couplings': 'Precise mathematical relationships'
+    }),
+    'physical_reality': MappingProxyType({
+        'fields': 'Quantum fluctuations and uncertainty',
+        'symmetries': 'Dynamically broken in nature',
+        'couplings': 'Scale-dependent and uncertain'
+    }),
+    'theoretical_bridge': MappingProxyType({
+        'quantum_vacuum': 'Mathematical infinity meets physical finiteness',
+        'symmetry_breaking': 'Perfect theory meets complex reality',
+        'unification': 'Mathematical beauty guides physical understanding'
+    })
+})
+
+_VACUUM_STRUCTURE = MappingProxyType({
+    'mathematical_description': MappingProxyType({
+        'vacuum_state': 'Perfect mathematical ground state',
+        'energy_levels': 'Exact quantum spectrum',
+        'symmetries': 'Perfect theoretical invariance'
+    }),
+    'physical_reality': MappingProxyType({
+        'vacuum_state': 'Complex quantum structure',
+        'energy_levels': 'Measurement-limited spectrum',
+        'symmetries': 'Approximately realized'
+    }),
+    'theoretical_tension': MappingProxyType({
+        'infinity': 'Mathematical divergences',
+        'finiteness': 'Physical observations',
+        'reconciliation': 'Seeking consistent framework'
+    })
+})
+
+class _ArrayResult(MappingABC):
+    """Shared behaviour of the array-valued results below.
+
+    Results are read-only mappings of field name to value, so callers written
+    against the old dict results (indexing, `in`, keys(), items(), dict())
+    keep working.
+    """
+
+    __slots__ = ()
+
+    # __match_args__ is the dataclass's field names, in order
+
+    def __getitem__(self, key: str):
+        if key not in self.__match_args__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__match_args__)
+
+    def __len__(self) -> int:
+        return len(self.__match_args__)
+
+    def as_dict(self) -> Dict:
+        return asdict(self)
+
+@dataclass(frozen=True, slots=True)
+class DensityEvolution(_ArrayResult):
+    """Dark energy densities at one or more redshifts."""
+    redshift: np.ndarray
+    scale_factor: np.ndarray
+    void_density: np.ndarray
+    filament_density: np.ndarray
+    total_density: np.ndarray
+    density_ratio: np.ndarray
+
+@dataclass(frozen=True, slots=True)
+class FutureEvolution(_ArrayResult):
+    """Predicted dark energy state at one or more future times."""
+    time_gyr: np.ndarray
+    lambda_t: np.ndarray
+    equation_of_state_w: np.ndarray
+    energy_density: np.ndarray
+    acceleration_parameter: np.ndarray
+
 class QDTDarkEnergyModel:
     """Framework exploring dark energy through mathematical models and physical mysteries.
     
@@ -32,15 +136,24 @@ class QDTDarkEnergyModel:
     """
 
     def __init__(self):
-        self.constants = QDTConstants()
+        self.constants = DEFAULT_CONSTANTS
+        # Hot paths read these plain attributes rather than the mapping below
+        self._lambda = self.constants.LAMBDA
+        self._gamma = self.constants.GAMMA
+        self._eta = self.constants.ETA
+        self._current_density = 6.91e-27
+        self._w0 = -(2 * self._lambda - 1) / (3 * self._lambda)
         # Mathematical precision meets physical uncertainty
-        self.dark_energy_parameters = {
-            'lambda': self.constants.LAMBDA,  # Mathematical: exact parameter / Physical: observed ratio
-            'current_density': 6.91e-27,  # Mathematical: precise value / Physical: measurement uncertainty
-            'equation_of_state': -(2 * self.constants.LAMBDA - 1) / (3 * self.constants.LAMBDA)  # Math model meets physical reality
-        }
+        self.dark_energy_parameters = MappingProxyType({
+            'lambda': self._lambda,  # Mathematical: exact parameter / Physical: observed ratio
+            'current_density': self._current_density,  # Mathematical: precise value / Physical: measurement uncertainty
+            'equation_of_state': self._w0  # Math model meets physical reality
+        })
+        # Scaling exponents of the void and filament densities
+        self._void_exponent = -3 * self.constants.BETA
+        self._filament_exponent = -3 * (1 - self.constants.BETA)
 
-    def analyze_dark_energy_model(self) -> Dict:
+    def analyze_dark_energy_model(self) -> Mapping:
         """Study dark energy where mathematical elegance meets physical mystery.
         
         Mathematical Framework:
@@ -53,25 +166,9 @@ class QDTDarkEnergyModel:
         - Measurement limits
         - Quantum effects
         """
-        return {
-            'mathematical_structure': {
-                'equations': 'Perfect mathematical form',
-                'symmetries': 'Exact theoretical invariance',
-                'parameters': 'Precise numerical values'
-            },
-            'physical_reality': {
-                'nature': 'Fundamentally mysterious',
-                'measurements': 'Limited by observation',
-                'quantum_effects': 'Poorly understood'
-            },
-            'theoretical_tension': {
-                'elegance': 'Mathematical beauty suggests truth',
-                'mystery': 'Physical nature remains elusive',
-                'reconciliation': 'Seeking bridge between form and substance'
-            }
-        }
-
-    def explore_particle_physics_connections(self) -> Dict:
+        return _DARK_ENERGY_MODEL
+
+    def explore_particle_physics_connections(self) -> Mapping:
         """Investigate dark energy's relationship with particle physics.
         
         Mathematical Domain:
@@ -84,27 +181,14 @@ class QDTDarkEnergyModel:
         - Broken symmetries
         - Running couplings
         """
-        return {
-            'mathematical_framework': {
-                'fields': 'Perfect quantum field theory',
-                'symmetries': 'Exact gauge invariance',
-                'couplings': 'Precise mathematical relationships'
-            },
-            'physical_reality': {
-                'fields': 'Quantum fluctuations and uncertainty',
-                'symmetries': 'Dynamically broken in nature',
-                'couplings': 'Scale-dependent and uncertain'
-            },
-            'theoretical_bridge': {
-                'quantum_vacuum': 'Mathematical infinity meets physical finiteness',
-                'symmetry_breaking': 'Perfect theory meets complex reality',
-                'unification': 'Mathematical beauty guides physical understanding'
-            }
-        }
-
-    def calculate_energy_density_evolution(self, redshift: float) -> Dict[str, float]:
+        return _PARTICLE_PHYSICS_CONNECTIONS
+
+    def calculate_energy_density_evolution(self, redshift: ArrayLike) -> DensityEvolution:
         """Study dark energy evolution balancing mathematical precision with physical uncertainty.
         
+        Accepts a single redshift or an array of them; every entry of the
+        result has the shape of the input.
+        
         Mathematical Model:
         - Perfect scaling laws
         - Exact evolution equations
@@ -115,28 +199,30 @@ class QDTDarkEnergyModel:
         - Unknown dynamics
         - Quantum corrections
         """
+        lam = self._lambda
+        rho0 = self._current_density
+        
+        redshift = np.asarray(redshift, dtype=float)
+        
         # Scale factor
-        a = 1 / (1 + redshift)
+        a = 1.0 / (1.0 + redshift)
         
         # QDT-modified evolution
-        void_density = self.dark_energy_parameters['current_density'] * \
-                      self.constants.LAMBDA * a**(-3 * self.constants.BETA)
-        
-        filament_density = self.dark_energy_parameters['current_density'] * \
-                          (1 - self.constants.LAMBDA) * a**(-3 * (1 - self.constants.BETA))
+        void_density = rho0 * lam * np.power(a, self._void_exponent)
+        filament_density = rho0 * (1 - lam) * np.power(a, self._filament_exponent)
         
         total_density = void_density + filament_density
         
-        return {
-            'redshift': redshift,
-            'scale_factor': a,
-            'void_density': void_density,
-            'filament_density': filament_density,
-            'total_density': total_density,
-            'density_ratio': total_density / self.dark_energy_parameters['current_density']
-        }
+        return DensityEvolution(
+            redshift=redshift,
+            scale_factor=a,
+            void_density=void_density,
+            filament_density=filament_density,
+            total_density=total_density,
+            density_ratio=total_density / rho0
+        )
 
-    def predict_future_evolution(self, time_gyr: float) -> Dict:
+    def predict_future_evolution(self, time_gyr: ArrayLike) -> FutureEvolution:
         """Explore future evolution where mathematical certainty meets physical uncertainty.
         
         Mathematical Extrapolation:
@@ -151,32 +237,34 @@ class QDTDarkEnergyModel:
         
         The gap between mathematical prediction and physical reality
         grows with the prediction timespan.
+        
+        Accepts a single time or an array of times in Gyr.
         """
         # Current age of universe in Gyr
         t0 = 13.8
         
         # Time ratio
+        time_gyr = np.asarray(time_gyr, dtype=float)
         tau = time_gyr / t0
         
         # QDT evolution of λ
-        lambda_t = self.constants.LAMBDA * \
-                  (1 - self.constants.GAMMA * np.log(tau)) * \
-                  np.cos(2 * np.pi * self.constants.ETA * tau)
+        lambda_t = self._lambda * \
+                  (1 - self._gamma * np.log(tau)) * \
+                  np.cos(2 * np.pi * self._eta * tau)
         
-        # Derived quantities
+        # Derived quantities; exp(3(1+w) ln tau) is tau**(3(1+w))
         w_t = -(2 * lambda_t - 1) / (3 * lambda_t)
-        rho_t = self.dark_energy_parameters['current_density'] * \
-                np.exp(3 * (1 + w_t) * np.log(tau))
-        
-        return {
-            'time_gyr': time_gyr,
-            'lambda_t': lambda_t,
-            'equation_of_state_w': w_t,
-            'energy_density': rho_t,
-            'acceleration_parameter': -rho_t * (1 + 3 * w_t) / 2
-        }
-
-    def analyze_vacuum_structure(self) -> Dict:
+        rho_t = self._current_density * tau**(3 * (1 + w_t))
+        
+        return FutureEvolution(
+            time_gyr=time_gyr,
+            lambda_t=lambda_t,
+            equation_of_state_w=w_t,
+            energy_density=rho_t,
+            acceleration_parameter=-rho_t * (1 + 3 * w_t) / 2
+        )
+
+    def analyze_vacuum_structure(self) -> Mapping:
         """Study vacuum structure where mathematical infinity meets physical finiteness.
         
         Mathematical Framework:
@@ -189,20 +277,4 @@ class QDTDarkEnergyModel:
         - Quantum uncertainties
         - Complex vacuum structure
         """
-        return {
-            'mathematical_description': {
-                'vacuum_state': 'Perfect mathematical ground state',
-                'energy_levels': 'Exact quantum spectrum',
-                'symmetries': 'Perfect theoretical invariance'
-            },
-            'physical_reality': {
-                'vacuum_state': 'Complex quantum structure',
-                'energy_levels': 'Measurement-limited spectrum',
-                'symmetries': 'Approximately realized'
-            },
-            'theoretical_tension': {
-                'infinity': 'Mathematical divergences',
-                'finiteness': 'Physical observations',
-                'reconciliation': 'Seeking consistent framework'
-            }
-        } 
\ No newline at end of file
+        return _VACUUM_STRUCTURE 
\ No newline at end of file
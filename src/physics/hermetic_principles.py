@@ -1,8 +1,78 @@
-from networkx import sigma # type: ignore
 import numpy as np # type: ignore
-from typing import Dict, List, Tuple
+from numpy.typing import ArrayLike # type: ignore
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 from dataclasses import dataclass
-from .constants import QDTConstants
+from .constants import DEFAULT_CONSTANTS
+
+# The models always use DEFAULT_CONSTANTS, so these descriptive tables and
+# their formatted values are built once as read-only views
+_LAMBDA_STR = f'λ = {DEFAULT_CONSTANTS.LAMBDA:.6f}'
+_LAMBDA_APPROX_STR = f'λ ≈ {DEFAULT_CONSTANTS.LAMBDA:.6f}'
+
+_POTENTIAL_CONNECTIONS = MappingProxyType({
+    'observed_similarities': MappingProxyType({
+        'network_patterns': MappingProxyType({
+            'system_a': 'Neural structures',
+            'system_b': 'Cosmic structures',
+            'observed_parameter': DEFAULT_CONSTANTS.LAMBDA
+        })
+    }),
+    'dynamic_similarities': MappingProxyType({
+        'pattern_a': MappingProxyType({
+            'description': 'Neural activity patterns',
+            'observed_value': _LAMBDA_APPROX_STR
+        }),
+        'pattern_b': MappingProxyType({
+            'description': 'Gravitational patterns',
+            'observed_value': _LAMBDA_APPROX_STR
+        })
+    }),
+    'observed_parameters': MappingProxyType({
+        'geometric_ratio': DEFAULT_CONSTANTS.PHI,
+        'distribution_parameter': DEFAULT_CONSTANTS.LAMBDA,
+        'recursion_parameter': DEFAULT_CONSTANTS.BETA,
+        'temporal_parameter': DEFAULT_CONSTANTS.ETA
+    })
+})
+
+_CONSCIOUSNESS_COSMOS = MappingProxyType({
+    'structural_parallels': MappingProxyType({
+        'neural_networks': MappingProxyType({
+            'void_regions': 'Synaptic gaps',
+            'filament_regions': 'Axonal connections',
+            'coupling_constant': DEFAULT_CONSTANTS.LAMBDA
+        }),
+        'cosmic_web': MappingProxyType({
+            'void_regions': 'Cosmic voids',
+            'filament_regions': 'Galactic filaments',
+            'coupling_constant': DEFAULT_CONSTANTS.LAMBDA
+        })
+    }),
+    'dynamic_parallels': MappingProxyType({
+        'thought_formation': MappingProxyType({
+            'process': 'Neural activation patterns',
+            'qdt_signature': _LAMBDA_STR
+        }),
+        'galaxy_formation': MappingProxyType({
+            'process': 'Gravitational coalescence',
+            'qdt_signature': _LAMBDA_STR
+        })
+    }),
+    'unifying_principles': MappingProxyType({
+        'phi_presence': DEFAULT_CONSTANTS.PHI,
+        'void_filament_balance': DEFAULT_CONSTANTS.LAMBDA,
+        'fractal_recursion': DEFAULT_CONSTANTS.BETA,
+        'temporal_harmony': DEFAULT_CONSTANTS.ETA
+    })
+})
+
+def _powers(base: float, n: int) -> np.ndarray:
+    """base**0 .. base**(n-1) by cumulative multiplication rather than pow"""
+    out = np.full(n, base, dtype=float)
+    if n:
+        out[0] = 1.0
+    return np.multiply.accumulate(out, out=out)
 
 @dataclass
 class ScaleLevel:
@@ -16,17 +86,6 @@ class ScaleLevel:
     description: str  # physical reality with its inherent complexities
     archetypal_pattern: str  # bridge between mathematical pattern and physical manifestation
 
-@dataclass
-class QDTConstants:
-    """Proposed parameters for QDT framework exploration.
-    Note: These values are hypothetical and used for theoretical investigation only.
-    They do not represent proven physical or mathematical constants."""
-    
-    LAMBDA: float = 0.867
-    GAMMA: float = 0.4497
-    BETA: float = 0.310
-    ETA: float = 0.520
-
 class HermeticQDT:
     """Framework exploring scale relationships while acknowledging the math-physics divide.
     
@@ -42,7 +101,7 @@ class HermeticQDT:
     """
 
     def __init__(self):
-        self.constants = QDTConstants()
+        self.constants = DEFAULT_CONSTANTS
         self.scales = {
             'quantum': ScaleLevel(
                 'quantum',
@@ -100,6 +159,13 @@ class HermeticQDT:
             )
         }
         self.critical_line = 0.5
+        
+        # The scales are fixed, so their coupling parameters are computed once
+        self._scales_arr = np.array([level.scale for level in self.scales.values()])
+        self._lambda_arr = self._compute_scale_lambda(self._scales_arr)
+        self._lambda_by_scale = dict(zip(self._scales_arr.tolist(), self._lambda_arr))
+        self._distribution_arr = np.stack([self._lambda_arr, 1 - self._lambda_arr], axis=-1)
+        self._distribution_arr.flags.writeable = False
 
     def explore_scale_relationships(self, scale1_name: str, scale2_name: str) -> Dict:
         """Explore relationships between scales, explicitly noting idealizations.
@@ -124,42 +190,55 @@ class HermeticQDT:
         
         return {
             'scale_ratio': scale_ratio,
-            'potential_correlation': self._calculate_lambda_correlation(lambda1, lambda2),
-            'pattern_analysis': self._study_pattern_relationships(scale1, scale2),
+            'potential_correlation': 1 - abs(lambda1 - lambda2) / self.constants.LAMBDA,
+            'pattern_analysis': {
+                'pattern1': scale1.archetypal_pattern,
+                'pattern2': scale2.archetypal_pattern,
+                'potential_relationship': self.constants.PHI  # Proposed relationship factor
+            },
             'distribution_patterns': {
-                'scale1': self._calculate_distribution_ratio(scale1.scale),
-                'scale2': self._calculate_distribution_ratio(scale2.scale)
+                'scale1': {'component_a': lambda1, 'component_b': 1 - lambda1},
+                'scale2': {'component_a': lambda2, 'component_b': 1 - lambda2}
             }
         }
 
-    def _calculate_scale_lambda(self, scale: float) -> float:
-        """Calculate hypothetical scaling parameter"""
+    def all_pairwise_correspondences(self) -> Dict:
+        """Scale ratios and lambda correlations for every pair of scales
+        
+        Entry [i, j] of each matrix matches explore_scale_relationships with
+        names[i] as scale1 and names[j] as scale2.
+        """
+        scales = self._scales_arr
+        lambdas = self._lambda_arr
+        
+        return {
+            'names': list(self.scales),
+            'scale_ratio': np.log10(scales[None, :] / scales[:, None]),
+            'lambda_correlation': 1 - np.abs(lambdas[:, None] - lambdas[None, :]) / self.constants.LAMBDA
+        }
+
+    def _calculate_scale_lambda(self, scale: ArrayLike):
+        """Calculate hypothetical scaling parameter for a scale or array of scales"""
+        if np.ndim(scale):
+            return self._compute_scale_lambda(np.asarray(scale, dtype=float))
+        cached = self._lambda_by_scale.get(scale)
+        return cached if cached is not None else self._compute_scale_lambda(scale)
+
+    def _compute_scale_lambda(self, scale):
+        """Scaling parameter for a scale or array of scales"""
         # Note: This is a theoretical model only
         log_scale_factor = np.log(scale / 1e-35)  # Approximate Planck scale
         proposed_correction = np.exp(-self.constants.GAMMA * log_scale_factor)
         
         return self.constants.LAMBDA * (1 + proposed_correction)
 
-    def _calculate_lambda_correlation(self, lambda1: float, lambda2: float) -> float:
-        """Study potential correlations between scaling parameters"""
-        return 1 - np.abs(lambda1 - lambda2) / self.constants.LAMBDA
-
-    def _study_pattern_relationships(self, scale1: ScaleLevel, scale2: ScaleLevel) -> Dict:
-        """Study potential relationships between observed patterns"""
-        return {
-            'pattern1': scale1.archetypal_pattern,
-            'pattern2': scale2.archetypal_pattern,
-            'potential_relationship': self.constants.PHI  # Proposed relationship factor
-        }
-
-    def _calculate_distribution_ratio(self, scale: float) -> Dict[str, float]:
-        """Study distribution patterns at given scale"""
-        parameter = self._calculate_scale_lambda(scale)
+    def distribution_ratios(self) -> np.ndarray:
+        """Distribution components for every scale as a read-only (n_scales, 2) array
         
-        return {
-            'component_a': parameter,
-            'component_b': 1 - parameter
-        }
+        Rows follow the order of self.scales; columns are the component_a
+        and component_b entries of explore_scale_relationships.
+        """
+        return self._distribution_arr
 
     def study_geometric_relationships(self) -> Dict:
         """Study potential geometric relationships across scales"""
@@ -171,14 +250,15 @@ class HermeticQDT:
         proposed_correction = observed_parameter - proposed_relationship
         
         # Examine patterns across scales
-        scale_patterns = {}
-        for scale_name, scale_data in self.scales.items():
-            parameter = self._calculate_scale_lambda(scale_data.scale)
-            scale_patterns[scale_name] = {
+        differences = self._lambda_arr - proposed_relationship
+        scale_patterns = {
+            scale_name: {
                 'proposed_value': proposed_relationship,
                 'observed_value': parameter,
-                'difference': parameter - proposed_relationship
+                'difference': difference
             }
+            for scale_name, parameter, difference in zip(self.scales, self._lambda_arr, differences)
+        }
         
         return {
             'phi': phi,
@@ -192,16 +272,23 @@ class HermeticQDT:
         """Study potential recursive patterns in the framework"""
         proposed_dimension = -np.log(self.constants.LAMBDA) / np.log(self.constants.PHI)
         
-        patterns = {}
-        for level in range(num_levels):
-            scale_factor = self.constants.LAMBDA ** level
-            
-            patterns[level] = {
+        # All levels are evaluated together, then unpacked per level
+        # (LAMBDA**k)**-D and PHI**k * exp(-GAMMA*k) are geometric in k
+        levels = np.arange(num_levels)
+        scale_factors = _powers(self.constants.LAMBDA, num_levels)
+        densities = _powers(self.constants.LAMBDA ** -proposed_dimension, num_levels)
+        
+        patterns = {
+            level: {
                 'scale_factor': scale_factor,
-                'pattern_density_a': scale_factor ** (-proposed_dimension),
-                'pattern_density_b': scale_factor ** (-proposed_dimension) * self.constants.PHI,
-                'complexity_measure': self._study_pattern_complexity(level)
+                'pattern_density_a': density_a,
+                'pattern_density_b': density_b,
+                'complexity_measure': complexity
             }
+            for level, scale_factor, density_a, density_b, complexity in zip(
+                levels.tolist(), scale_factors, densities,
+                densities * self.constants.PHI, self._complexity_series(num_levels))
+        }
         
         return {
             'proposed_dimension': proposed_dimension,
@@ -209,77 +296,44 @@ class HermeticQDT:
             'relationship_factor': self.constants.LAMBDA * self.constants.PHI
         }
 
-    def _study_pattern_complexity(self, level: int) -> float:
-        """Study complexity patterns at different levels"""
+    def _study_pattern_complexity(self, level):
+        """Study complexity patterns at different levels (a level or an array of levels)"""
         return (self.constants.PHI ** level) * np.exp(-self.constants.GAMMA * level)
 
-    def explore_potential_connections(self) -> Dict:
+    def _complexity_series(self, num_levels: int) -> np.ndarray:
+        """_study_pattern_complexity for levels 0 .. num_levels-1"""
+        return _powers(self.constants.PHI * np.exp(-self.constants.GAMMA), num_levels)
+
+    def explore_potential_connections(self) -> Mapping:
         """Explore potential relationships between different systems"""
-        return {
-            'observed_similarities': {
-                'network_patterns': {
-                    'system_a': 'Neural structures',
-                    'system_b': 'Cosmic structures',
-                    'observed_parameter': self.constants.LAMBDA
-                }
-            },
-            'dynamic_similarities': {
-                'pattern_a': {
-                    'description': 'Neural activity patterns',
-                    'observed_value': f'λ ≈ {self.constants.LAMBDA:.6f}'
-                },
-                'pattern_b': {
-                    'description': 'Gravitational patterns',
-                    'observed_value': f'λ ≈ {self.constants.LAMBDA:.6f}'
-                }
-            },
-            'observed_parameters': {
-                'geometric_ratio': self.constants.PHI,
-                'distribution_parameter': self.constants.LAMBDA,
-                'recursion_parameter': self.constants.BETA,
-                'temporal_parameter': self.constants.ETA
-            }
-        }
+        return _POTENTIAL_CONNECTIONS
 
     def analyze_scale_correspondence(self, scale1_name: str, scale2_name: str) -> Dict:
-        """Analyze the correspondence between two scales"""
-        scale1 = self.scales[scale1_name]
-        scale2 = self.scales[scale2_name]
-        
-        # Calculate scale ratio
-        scale_ratio = np.log10(scale2.scale / scale1.scale)
+        """Analyze the correspondence between two scales
         
-        # QDT coupling at each scale
-        lambda1 = self._calculate_scale_lambda(scale1.scale)
-        lambda2 = self._calculate_scale_lambda(scale2.scale)
+        Same analysis as explore_scale_relationships, reported under the
+        void-filament naming.
+        """
+        relationship = self.explore_scale_relationships(scale1_name, scale2_name)
+        patterns = relationship['pattern_analysis']
         
         return {
-            'scale_ratio': scale_ratio,
-            'lambda_correlation': self._calculate_lambda_correlation(lambda1, lambda2),
-            'archetypal_resonance': self._analyze_archetypal_resonance(scale1, scale2),
+            'scale_ratio': relationship['scale_ratio'],
+            'lambda_correlation': relationship['potential_correlation'],
+            'archetypal_resonance': {
+                'pattern1': patterns['pattern1'],
+                'pattern2': patterns['pattern2'],
+                'resonance_strength': patterns['potential_relationship']  # Golden ratio as resonance factor
+            },
             'void_filament_pattern': {
-                'scale1': self._calculate_void_filament_ratio(scale1.scale),
-                'scale2': self._calculate_void_filament_ratio(scale2.scale)
+                scale: {
+                    'void_fraction': ratio['component_a'],
+                    'filament_fraction': ratio['component_b']
+                }
+                for scale, ratio in relationship['distribution_patterns'].items()
             }
         }
 
-    def _analyze_archetypal_resonance(self, scale1: ScaleLevel, scale2: ScaleLevel) -> Dict:
-        """Analyze resonance between archetypal patterns"""
-        return {
-            'pattern1': scale1.archetypal_pattern,
-            'pattern2': scale2.archetypal_pattern,
-            'resonance_strength': self.constants.PHI  # Golden ratio as resonance factor
-        }
-
-    def _calculate_void_filament_ratio(self, scale: float) -> Dict[str, float]:
-        """Calculate void-filament ratio at given scale"""
-        effective_lambda = self._calculate_scale_lambda(scale)
-        
-        return {
-            'void_fraction': effective_lambda,
-            'filament_fraction': 1 - effective_lambda
-        }
-
     def demonstrate_golden_ratio_universality(self) -> Dict:
         """Demonstrate universal golden ratio relationships"""
         phi = self.constants.PHI
@@ -290,14 +344,15 @@ class HermeticQDT:
         quantum_correction = lambda_observed - lambda_theoretical
         
         # Verify correction appears at all scales
-        scale_corrections = {}
-        for scale_name, scale_data in self.scales.items():
-            effective_lambda = self._calculate_scale_lambda(scale_data.scale)
-            scale_corrections[scale_name] = {
+        corrections = self._lambda_arr - lambda_theoretical
+        scale_corrections = {
+            scale_name: {
                 'theoretical_lambda': lambda_theoretical,
                 'effective_lambda': effective_lambda,
-                'quantum_correction': effective_lambda - lambda_theoretical
+                'quantum_correction': correction
             }
+            for scale_name, effective_lambda, correction in zip(self.scales, self._lambda_arr, corrections)
+        }
         
         return {
             'phi': phi,
@@ -311,17 +366,23 @@ class HermeticQDT:
         """Analyze fractal nature of reality through QDT lens"""
         fractal_dimension = -np.log(self.constants.LAMBDA) / np.log(self.constants.PHI)
         
-        levels = {}
-        for level in range(num_levels):
-            scale_factor = self.constants.LAMBDA ** level
-            
-            # Each level contains patterns of all others
-            levels[level] = {
+        # Each level contains patterns of all others; all levels are
+        # evaluated together, then unpacked per level
+        level_index = np.arange(num_levels)
+        scale_factors = _powers(self.constants.LAMBDA, num_levels)
+        void_densities = _powers(self.constants.LAMBDA ** -fractal_dimension, num_levels)
+        
+        levels = {
+            level: {
                 'scale_factor': scale_factor,
-                'void_density': scale_factor ** (-fractal_dimension),
-                'filament_density': scale_factor ** (-fractal_dimension) * self.constants.PHI,
-                'pattern_complexity': self._calculate_pattern_complexity(level)
+                'void_density': void_density,
+                'filament_density': filament_density,
+                'pattern_complexity': complexity
             }
+            for level, scale_factor, void_density, filament_density, complexity in zip(
+                level_index.tolist(), scale_factors, void_densities,
+                void_densities * self.constants.PHI, self._complexity_series(num_levels))
+        }
         
         return {
             'fractal_dimension': fractal_dimension,
@@ -329,46 +390,18 @@ class HermeticQDT:
             'unity_factor': self.constants.LAMBDA * self.constants.PHI  # ≈ 1
         }
 
-    def _calculate_pattern_complexity(self, level: int) -> float:
-        """Calculate complexity of patterns at given fractal level"""
-        return (self.constants.PHI ** level) * np.exp(-self.constants.GAMMA * level)
+    # Fractal levels use the same complexity measure as recursive patterns
+    _calculate_pattern_complexity = _study_pattern_complexity
 
-    def analyze_consciousness_cosmos_connection(self) -> Dict:
+    def analyze_consciousness_cosmos_connection(self) -> Mapping:
         """Analyze the deep connection between consciousness and cosmos"""
-        return {
-            'structural_parallels': {
-                'neural_networks': {
-                    'void_regions': 'Synaptic gaps',
-                    'filament_regions': 'Axonal connections',
-                    'coupling_constant': self.constants.LAMBDA
-                },
-                'cosmic_web': {
-                    'void_regions': 'Cosmic voids',
-                    'filament_regions': 'Galactic filaments',
-                    'coupling_constant': self.constants.LAMBDA
-                }
-            },
-            'dynamic_parallels': {
-                'thought_formation': {
-                    'process': 'Neural activation patterns',
-                    'qdt_signature': f'λ = {self.constants.LAMBDA:.6f}'
-                },
-                'galaxy_formation': {
-                    'process': 'Gravitational coalescence',
-                    'qdt_signature': f'λ = {self.constants.LAMBDA:.6f}'
-                }
-            },
-            'unifying_principles': {
-                'phi_presence': self.constants.PHI,
-                'void_filament_balance': self.constants.LAMBDA,
-                'fractal_recursion': self.constants.BETA,
-                'temporal_harmony': self.constants.ETA
-            }
-        }
+        return _CONSCIOUSNESS_COSMOS
 
-    def analyze_void_filament_balance(self, s: complex):
+    def analyze_void_filament_balance(self, sigma):
         """Analyze void-filament energy balance.
         
+        sigma may be a single complex value or an array of them.
+        
         Mathematical Idealization:
         - Perfect energy partitioning
         - Exact coupling constants
@@ -379,9 +412,11 @@ class HermeticQDT:
         - Fluctuating coupling strengths
         - Complex interdependencies
         """
-        # Mathematical domain: perfect energy calculations
-        void_energy = self.constants.LAMBDA * (sigma - self.critical_line)**2
-        filament_energy = (1 - self.constants.LAMBDA) * (sigma - self.critical_line)**2
+        # Mathematical domain: perfect energy calculations; the squared
+        # offset from the critical line is shared by both components
+        offset_sq = (np.asarray(sigma) - self.critical_line)**2
+        void_energy = self.constants.LAMBDA * offset_sq
+        filament_energy = (1 - self.constants.LAMBDA) * offset_sq
         
         # Physical domain: acknowledge approximation
         return {
@@ -400,11 +435,14 @@ class HermeticQDT:
             }
         }
 
+# Fixed summary, built once as a read-only view
+_SUMMARY = MappingProxyType({
+    "theoretical_framework": MappingProxyType({
+        "description": "Proposed mathematical framework combining several parameters",
+        "status": "Hypothetical model requiring validation"
+    })
+})
+
 class QDTFindings:
-    def summarize_actual_results(self):
-        return {
-            "theoretical_framework": {
-                "description": "Proposed mathematical framework combining several parameters",
-                "status": "Hypothetical model requiring validation"
-            }
-        } 
\ No newline at end of file
+    def summarize_actual_results(self) -> Mapping:
+        return _SUMMARY 
\ No newline at end of file
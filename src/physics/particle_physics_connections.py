@@ -1,7 +1,9 @@
+import math
 import numpy as np
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
-from .constants import QDTConstants
+from numpy.typing import ArrayLike # type: ignore
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+from .constants import DEFAULT_CONSTANTS, QDTConstants
 
 """Particle Physics QDT Module
 
@@ -22,19 +24,52 @@ The challenge lies in bridging the gap between mathematical perfection
 and the messy reality of particle interactions.
 """
 
-@dataclass
-class QDTConstants:
-    """Constants bridging mathematical symmetry and physical complexity.
-    
-    Each constant represents:
-    1. A mathematical ideal in group theory
-    2. An approximation of complex particle interactions
-    """
-    LAMBDA: float = 0.867    # Mathematical: symmetry parameter / Physical: interaction strength
-    GAMMA: float = 0.4497    # Mathematical: group parameter / Physical: coupling evolution
-    BETA: float = 0.310      # Mathematical: structure constant / Physical: scale dependence
-    ETA: float = 0.520       # Mathematical: phase factor / Physical: interaction rate
-    PHI: float = 1.618033988749  # Mathematical: exact / Physical: emergent ratio
+# Descriptive tables are fixed, so they are built once as read-only views
+_STANDARD_MODEL = MappingProxyType({
+    'mathematical_structure': MappingProxyType({
+        'gauge_groups': 'Perfect mathematical symmetries',
+        'quantum_numbers': 'Exact conservation laws',
+        'coupling_constants': 'Precise mathematical relationships'
+    }),
+    'physical_reality': MappingProxyType({
+        'symmetry_breaking': 'Dynamically broken in nature',
+        'quantum_effects': 'Radiative corrections modify ideals',
+        'interaction_complexity': 'Beyond simple group theory'
+    })
+})
+
+_SYMMETRY_BREAKING = MappingProxyType({
+    'mathematical_description': MappingProxyType({
+        'symmetry': 'Perfect group structure',
+        'breaking': 'Exact mathematical patterns',
+        'phases': 'Clean transition points'
+    }),
+    'physical_reality': MappingProxyType({
+        'dynamics': 'Complex time evolution',
+        'fluctuations': 'Quantum uncertainties',
+        'thermal_effects': 'Temperature dependence'
+    })
+})
+
+_BEYOND_STANDARD_MODEL = MappingProxyType({
+    'dark_matter': 'Sterile void fluctuations',
+    'extra_dimensions': 'Higher-order QDT recursions',
+    'unification': 'All forces unified through QDT coupling'
+})
+
+# Couplings at the reference scale
+_ALPHA_EM_0 = 1/137.036
+_ALPHA_W_0 = 1/29.6
+_ALPHA_S_0 = 0.118
+
+def _running_couplings(lambda_factor) -> Dict[str, float]:
+    """Electromagnetic, weak and strong couplings for a scalar or array lambda factor"""
+    one_minus = 1 - lambda_factor
+    return {
+        'electromagnetic': _ALPHA_EM_0 * lambda_factor**2,
+        'weak': _ALPHA_W_0 * lambda_factor * one_minus,
+        'strong': _ALPHA_S_0 * one_minus**2
+    }
 
 class ParticlePhysicsConnections:
     """Framework exploring particle physics through mathematical and physical lenses.
@@ -46,13 +81,23 @@ class ParticlePhysicsConnections:
     """
     
     def __init__(self, constants: QDTConstants = None):
-        self.constants = constants or QDTConstants()
+        self.constants = constants or DEFAULT_CONSTANTS
         # Mathematical idealization meets experimental reality
         self.standard_model_parameters = self._initialize_standard_model()
         self.symmetry_breaking = self._initialize_symmetry_breaking()
         self.beyond_standard_model = self._initialize_bsm()
+        # Derived constants, fixed for a given set of constants
+        c = self.constants
+        self._one_minus_lam = 1.0 - c.LAMBDA
+        self._sqrt_lam = math.sqrt(c.LAMBDA)
+        self._sqrt_one_minus_lam = math.sqrt(self._one_minus_lam)
+        self._higgs_denom = math.sqrt(1.0 - c.LAMBDA * c.LAMBDA)
+        self._Tc = c.ETA / (c.LAMBDA * c.GAMMA)
+        self._gut_coupling = c.LAMBDA * (1 - c.GAMMA)
+        self._beta_phi = c.BETA * c.PHI  # Lepton mass ladder factors
+        self._beta_phi2 = self._beta_phi * c.PHI
 
-    def _initialize_standard_model(self) -> Dict:
+    def _initialize_standard_model(self) -> Mapping:
         """Study standard model where mathematical beauty meets physical complexity.
         
         Mathematical Framework:
@@ -65,20 +110,9 @@ class ParticlePhysicsConnections:
         - Quantum corrections
         - Complex dynamics
         """
-        return {
-            'mathematical_structure': {
-                'gauge_groups': 'Perfect mathematical symmetries',
-                'quantum_numbers': 'Exact conservation laws',
-                'coupling_constants': 'Precise mathematical relationships'
-            },
-            'physical_reality': {
-                'symmetry_breaking': 'Dynamically broken in nature',
-                'quantum_effects': 'Radiative corrections modify ideals',
-                'interaction_complexity': 'Beyond simple group theory'
-            }
-        }
+        return _STANDARD_MODEL
 
-    def _initialize_symmetry_breaking(self) -> Dict:
+    def _initialize_symmetry_breaking(self) -> Mapping:
         """Explore symmetry breaking where mathematical perfection meets physical necessity.
         
         Mathematical Beauty:
@@ -91,26 +125,11 @@ class ParticlePhysicsConnections:
         - Quantum fluctuations
         - Thermal effects
         """
-        return {
-            'mathematical_description': {
-                'symmetry': 'Perfect group structure',
-                'breaking': 'Exact mathematical patterns',
-                'phases': 'Clean transition points'
-            },
-            'physical_reality': {
-                'dynamics': 'Complex time evolution',
-                'fluctuations': 'Quantum uncertainties',
-                'thermal_effects': 'Temperature dependence'
-            }
-        }
+        return _SYMMETRY_BREAKING
 
-    def _initialize_bsm(self) -> Dict:
+    def _initialize_bsm(self) -> Mapping:
         """Initialize beyond standard model predictions"""
-        return {
-            'dark_matter': 'Sterile void fluctuations',
-            'extra_dimensions': 'Higher-order QDT recursions',
-            'unification': 'All forces unified through QDT coupling'
-        }
+        return _BEYOND_STANDARD_MODEL
 
     def calculate_coupling_evolution(self, energy_scale: float) -> Dict[str, float]:
         """Study coupling evolution where mathematical prediction meets quantum reality.
@@ -125,29 +144,37 @@ class ParticlePhysicsConnections:
         - Scale dependence
         - Measurement limits
         """
-        # Base coupling at reference scale
-        alpha_em_0 = 1/137.036
-        alpha_w_0 = 1/29.6
-        alpha_s_0 = 0.118
-
-        # QDT-modified running couplings
-        lambda_factor = self.constants.LAMBDA * np.exp(-self.constants.GAMMA * np.log(energy_scale))
+        # QDT-modified running couplings; exp(-GAMMA ln E) is E**-GAMMA
+        lambda_factor = self.constants.LAMBDA * math.pow(energy_scale, -self.constants.GAMMA)
         
-        alpha_em = alpha_em_0 * lambda_factor**2
-        alpha_w = alpha_w_0 * lambda_factor * (1 - lambda_factor)
-        alpha_s = alpha_s_0 * (1 - lambda_factor)**2
-
         return {
-            'electromagnetic': alpha_em,
-            'weak': alpha_w,
-            'strong': alpha_s,
+            **_running_couplings(lambda_factor),
             'energy_scale': energy_scale,
             'lambda_factor': lambda_factor
         }
 
-    def predict_mass_spectrum(self, void_energy: float) -> Dict[str, float]:
+    def calculate_coupling_evolution_batch(self, energy_scales: ArrayLike) -> Dict[str, np.ndarray]:
+        """calculate_coupling_evolution over an array of energy scales
+        
+        Returns the same keys, each holding an array shaped like the input.
+        """
+        energy_scales = np.asarray(energy_scales, dtype=float)
+        
+        # exp(-GAMMA ln E) is E**-GAMMA
+        lambda_factor = self.constants.LAMBDA * energy_scales**(-self.constants.GAMMA)
+        
+        return {
+            **_running_couplings(lambda_factor),
+            'energy_scale': energy_scales,
+            'lambda_factor': lambda_factor
+        }
+
+    def predict_mass_spectrum(self, void_energy: ArrayLike) -> Dict[str, float]:
         """Explore mass generation where mathematical symmetry meets physical mass.
         
+        Accepts a single void energy or an array of them; each mass then has
+        the shape of the input.
+        
         Mathematical Domain:
         - Perfect Higgs mechanism
         - Exact mass ratios
@@ -159,16 +186,19 @@ class ParticlePhysicsConnections:
         - Experimental bounds
         """
         # QDT mass generation mechanism
+        # Plain floats skip array construction; the masses below are products only
+        if not isinstance(void_energy, (int, float)):
+            void_energy = np.asarray(void_energy, dtype=float)
         base_mass = void_energy * self.constants.LAMBDA
-        higgs_vev = base_mass / np.sqrt(1 - self.constants.LAMBDA**2)
+        higgs_vev = base_mass / self._higgs_denom
         
         # Mass predictions
         masses = {
             'electron': base_mass * self.constants.BETA,
-            'muon': base_mass * self.constants.BETA * self.constants.PHI,
-            'tau': base_mass * self.constants.BETA * self.constants.PHI**2,
-            'up_quark': base_mass * np.sqrt(self.constants.LAMBDA),
-            'down_quark': base_mass * np.sqrt(1 - self.constants.LAMBDA),
+            'muon': base_mass * self._beta_phi,
+            'tau': base_mass * self._beta_phi2,
+            'up_quark': base_mass * self._sqrt_lam,
+            'down_quark': base_mass * self._sqrt_one_minus_lam,
             'higgs': higgs_vev * 2
         }
 
@@ -188,10 +218,10 @@ class ParticlePhysicsConnections:
         - Fluctuation effects
         """
         # Critical temperature from QDT constants
-        T_c = self.constants.ETA / (self.constants.LAMBDA * self.constants.GAMMA)
+        T_c = self._Tc
         
         # Phase transition parameters
-        order_parameter = np.tanh((T_c - temperature) / T_c)
+        order_parameter = math.tanh((T_c - temperature) / T_c)
         vacuum_expectation = order_parameter * self.constants.LAMBDA
         
         return {
@@ -220,7 +250,7 @@ class ParticlePhysicsConnections:
             gravitational_coupling = unified_coupling * self.constants.BETA
         else:
             # GUT scale unification
-            unified_coupling = self.constants.LAMBDA * (1 - self.constants.GAMMA)
+            unified_coupling = self._gut_coupling
             gravitational_coupling = 0
             
         return {
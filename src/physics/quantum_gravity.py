@@ -1,5 +1,7 @@
 import numpy as np # type: ignore
-from typing import Dict, List, Tuple
+from numpy.typing import ArrayLike # type: ignore
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 from .constants import QDTConstants
 
 """Quantum Gravity QDT Module
@@ -22,6 +24,44 @@ The goal is to explore how mathematical idealization and physical reality
 might meet at the most fundamental level of nature.
 """
 
+# Descriptive tables are fixed, so they are built once as read-only views
+_GRANULARITY_BASE = MappingProxyType({
+    'mathematical_framework': MappingProxyType({
+        'description': 'Idealized geometric model',
+        'properties': MappingProxyType({
+            'continuity': 'Perfect mathematical continuity',
+            'symmetry': 'Exact geometric symmetries',
+            'dimensionality': 'Well-defined dimensions'
+        })
+    }),
+    'physical_reality': MappingProxyType({
+        'description': 'Quantum-limited structure',
+        'properties': MappingProxyType({
+            'granularity': 'Fundamental discreteness',
+            'uncertainty': 'Quantum fluctuations',
+            'limitations': 'Measurement bounds'
+        })
+    })
+})
+
+_QUANTUM_FOAM = MappingProxyType({
+    'mathematical_idealization': MappingProxyType({
+        'geometry': 'Perfect differential manifold',
+        'topology': 'Well-defined connectivity',
+        'symmetries': 'Exact geometric invariance'
+    }),
+    'physical_reality': MappingProxyType({
+        'geometry': 'Fluctuating quantum structure',
+        'topology': 'Dynamic connectivity changes',
+        'symmetries': 'Quantum-broken symmetries'
+    }),
+    'interface_dynamics': MappingProxyType({
+        'emergence': 'Classical space from quantum foam',
+        'measurement': 'Limits of geometric observation',
+        'uncertainty': 'Fundamental bounds on precision'
+    })
+})
+
 class QDTQuantumGravity:
     """Framework exploring quantum gravity through mathematical and physical lenses.
     
@@ -40,8 +80,24 @@ class QDTQuantumGravity:
             'energy': 1.956e9,    # joules - boundary of current physics
             'qdt_lambda': self.constants.LAMBDA,  # mathematical parameter meets physical scale
         }
+        # Derived values read on every correction and geometry call
+        self._planck_length = self.planck_scale_qdt['length']
+        self._one_minus_lam = 1 - self.constants.LAMBDA
+        self._nonlocality = f'Enhanced by factor {self.constants.LAMBDA:.3f}'
+        # Only the interface scale depends on the constants
+        self._granularity = MappingProxyType({
+            **_GRANULARITY_BASE,
+            'interface_region': MappingProxyType({
+                'description': 'Where math meets physics',
+                'properties': MappingProxyType({
+                    'scale': f'√({self.constants.LAMBDA}(1-{self.constants.LAMBDA})) * Planck length',
+                    'nature': 'Neither purely continuous nor discrete',
+                    'behavior': 'Quantum superposition of geometries'
+                })
+            })
+        })
 
-    def investigate_spacetime_granularity(self) -> Dict:
+    def investigate_spacetime_granularity(self) -> Mapping:
         """Explore spacetime structure at the math-physics boundary.
         
         Mathematical Idealization:
@@ -54,32 +110,7 @@ class QDTQuantumGravity:
         - Measurement limitations
         - Discrete structure
         """
-        return {
-            'mathematical_framework': {
-                'description': 'Idealized geometric model',
-                'properties': {
-                    'continuity': 'Perfect mathematical continuity',
-                    'symmetry': 'Exact geometric symmetries',
-                    'dimensionality': 'Well-defined dimensions'
-                }
-            },
-            'physical_reality': {
-                'description': 'Quantum-limited structure',
-                'properties': {
-                    'granularity': 'Fundamental discreteness',
-                    'uncertainty': 'Quantum fluctuations',
-                    'limitations': 'Measurement bounds'
-                }
-            },
-            'interface_region': {
-                'description': 'Where math meets physics',
-                'properties': {
-                    'scale': f'√({self.constants.LAMBDA}(1-{self.constants.LAMBDA})) * Planck length',
-                    'nature': 'Neither purely continuous nor discrete',
-                    'behavior': 'Quantum superposition of geometries'
-                }
-            }
-        }
+        return self._granularity
 
     def predict_black_hole_properties(self, mass_kg: float) -> Dict:
         """Study black holes where mathematical infinity meets physical reality.
@@ -117,7 +148,7 @@ class QDTQuantumGravity:
             }
         }
 
-    def explore_quantum_foam_structure(self) -> Dict:
+    def explore_quantum_foam_structure(self) -> Mapping:
         """Study quantum foam where mathematical continuity meets physical discreteness.
         
         Mathematical Framework:
@@ -130,27 +161,13 @@ class QDTQuantumGravity:
         - Broken symmetries
         - Quantum fluctuations
         """
-        return {
-            'mathematical_idealization': {
-                'geometry': 'Perfect differential manifold',
-                'topology': 'Well-defined connectivity',
-                'symmetries': 'Exact geometric invariance'
-            },
-            'physical_reality': {
-                'geometry': 'Fluctuating quantum structure',
-                'topology': 'Dynamic connectivity changes',
-                'symmetries': 'Quantum-broken symmetries'
-            },
-            'interface_dynamics': {
-                'emergence': 'Classical space from quantum foam',
-                'measurement': 'Limits of geometric observation',
-                'uncertainty': 'Fundamental bounds on precision'
-            }
-        }
+        return _QUANTUM_FOAM
 
-    def calculate_quantum_corrections(self, scale: float) -> Dict[str, float]:
+    def calculate_quantum_corrections(self, scale: ArrayLike) -> Dict[str, float]:
         """Calculate corrections where mathematical prediction meets physical limitation.
         
+        Accepts a single scale or an array of scales (meters).
+        
         Mathematical Domain:
         - Exact calculations
         - Perfect scaling
@@ -162,11 +179,11 @@ class QDTQuantumGravity:
         - Experimental limits
         """
         # Ratio of scale to Planck scale
-        scale_ratio = scale / self.planck_scale_qdt['length']
+        scale_ratio = np.asarray(scale, dtype=float) / self._planck_length
         
-        # QDT-modified quantum corrections
-        void_correction = self.constants.LAMBDA * np.exp(-self.constants.GAMMA * np.log(scale_ratio))
-        filament_correction = (1 - self.constants.LAMBDA) * np.exp(-self.constants.BETA * np.log(scale_ratio))
+        # QDT-modified quantum corrections; exp(-k ln r) is r**-k
+        void_correction = self.constants.LAMBDA * scale_ratio**(-self.constants.GAMMA)
+        filament_correction = self._one_minus_lam * scale_ratio**(-self.constants.BETA)
         
         # Total correction
         total_correction = void_correction + filament_correction
@@ -214,6 +231,6 @@ class QDTQuantumGravity:
             'quantum_effects': {
                 'geometry_uncertainty': corrections['filament_correction'],
                 'causal_structure': 'Modified by void-filament dynamics',
-                'nonlocality': f'Enhanced by factor {self.constants.LAMBDA:.3f}'
+                'nonlocality': self._nonlocality
             }
         } 
\ No newline at end of file
@@ -1,8 +1,108 @@
+import math
+import os
+import threading
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple, Optional, Any
 from dataclasses import dataclass
 from scipy.special import gamma, zeta
 from .constants import QDTConstants
+from .dark_energy import _ArrayResult
+from ._jit import HAVE_NUMBA, njit, prange
+
+@njit(fastmath=True)
+def _qdt_modifier(sigma, t, LAMBDA, GAMMA, BETA, ETA, critical_line):
+    """QDT factor applied to zeta at each point sigma + i*t (1-D arrays)."""
+    out = np.empty(sigma.size)
+    for i in range(sigma.size):
+        # Time mediation factor
+        kappa_t = math.exp(-GAMMA * abs(t[i])) * math.sin(2 * math.pi * t[i] * ETA)
+        
+        # Balance factor peaks on critical line, where exp(-0) is exactly 1
+        balance_factor = math.exp(-abs(sigma[i] - critical_line) / LAMBDA)
+        
+        out[i] = balance_factor * (1 + kappa_t * BETA)
+    return out
+
+# Below this many primes the NumPy path beats the threaded kernel's overhead
+_PRIME_KERNEL_MIN = 20_000
+
+@njit(parallel=True, fastmath=True)
+def _prime_resonance_kernel(primes, LAMBDA, GAMMA):
+    """Fused prime resonance pass; rows are frequency, strength, void,
+    filament and total energy."""
+    n = primes.size
+    out = np.empty((5, n))
+    for i in prange(n):
+        p = primes[i]
+        omega = 2 * math.pi / math.log(p)
+        strength = LAMBDA * math.exp(-GAMMA * p / 100)
+        void = strength * math.cos(omega)
+        filament = strength * math.sin(omega)
+        out[0, i] = omega
+        out[1, i] = strength
+        out[2, i] = void
+        out[3, i] = filament
+        out[4, i] = void * void + filament * filament
+    return out
+
+# Zero heights never change, so one growing prefix is kept in memory and on
+# disk; a request for more zeros extends it rather than starting over
+ZERO_CACHE_DIR = Path(os.getenv('QDT_CACHE_DIR', Path.home() / '.cache' / 'qdt'))
+_ZERO_CACHE_FILE = 'zetazeros.npy'
+_ZERO_DPS = 15
+_zero_heights = np.empty(0)
+_zero_heights_lock = threading.Lock()
+
+def _zeta_zero_heights(num_zeros: int) -> np.ndarray:
+    """Heights of the first num_zeros non-trivial zeta zeros (read-only)"""
+    global _zero_heights
+    with _zero_heights_lock:
+        if len(_zero_heights) < num_zeros:
+            heights = _zero_heights
+            try:
+                stored = np.load(ZERO_CACHE_DIR / _ZERO_CACHE_FILE)
+                if len(stored) > len(heights):
+                    heights = stored
+            except (OSError, ValueError):
+                pass
+            if len(heights) < num_zeros:
+                from mpmath import mp, zetazero
+                # Double precision is all a float64 cache can hold; pinning it
+                # keeps a raised global mp.dps from slowing every zero down
+                with mp.workdps(_ZERO_DPS):
+                    extra = [float(zetazero(n).imag) for n in range(len(heights) + 1, num_zeros + 1)]
+                heights = np.concatenate([heights, extra])
+                _store_zero_heights(heights)
+            heights.flags.writeable = False
+            _zero_heights = heights
+    return _zero_heights[:num_zeros]
+
+def _store_zero_heights(heights: np.ndarray) -> None:
+    """Best-effort write of the zero heights to the disk cache"""
+    try:
+        ZERO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = ZERO_CACHE_DIR / f'{_ZERO_CACHE_FILE}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.save(f, heights)
+        os.replace(tmp_path, ZERO_CACHE_DIR / _ZERO_CACHE_FILE)
+    except OSError:
+        pass  # The heights are still returned from memory
+
+@lru_cache(maxsize=8)
+def _primes_up_to(n: int) -> np.ndarray:
+    """Primes up to n by sieve of Eratosthenes (read-only)"""
+    sieve = np.ones(n + 1, dtype=bool)
+    sieve[:2] = False
+    
+    for i in range(2, int(n**0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = False
+    
+    primes = np.flatnonzero(sieve)
+    primes.flags.writeable = False
+    return primes
 
 @dataclass
 class ZeroPoint:
@@ -22,6 +122,31 @@ class ZeroPoint:
     filament_energy: float  # Physical analogy: not mathematically rigorous
     resonance_strength: float  # Physical analogy: not mathematically rigorous
 
+@dataclass(frozen=True, slots=True)
+class PrimeResonances(_ArrayResult):
+    """Resonance patterns for a set of primes, one array entry per prime."""
+    primes: np.ndarray
+    frequency: np.ndarray
+    strength: np.ndarray
+    void_contribution: np.ndarray
+    filament_contribution: np.ndarray
+    total_energy: np.ndarray
+
+    def as_dict_per_prime(self) -> Dict[int, Dict[str, float]]:
+        """Per-prime mapping in the layout analyze_prime_resonances used to return"""
+        return {
+            prime: {
+                'frequency': frequency,
+                'strength': strength,
+                'void_contribution': void,
+                'filament_contribution': filament,
+                'total_energy': energy
+            }
+            for prime, frequency, strength, void, filament, energy in zip(
+                self.primes.tolist(), self.frequency, self.strength,
+                self.void_contribution, self.filament_contribution, self.total_energy)
+        }
+
 class RiemannQDT:
     """Framework exploring Riemann Hypothesis through both mathematical and physical lenses.
     
@@ -37,9 +162,11 @@ class RiemannQDT:
         self.constants = QDTConstants()
         self.critical_line = 0.5  # Observed location of known non-trivial zeros
 
-    def qdt_zeta_function(self, s: complex) -> complex:
+    def qdt_zeta_function(self, s):
         """Study zeta function through QDT lens, clearly separating math from physics.
         
+        s may be a single complex value or an array of them.
+        
         Mathematical Components:
         - Exact zeta function values
         - Precise complex arithmetic
@@ -55,38 +182,23 @@ class RiemannQDT:
         # Note: This is a speculative modification for research purposes
         # It does not constitute a proof or verification of any properties
         
-        # Decompose into void and filament components
-        sigma = s.real
-        t = s.imag
-        
-        # Void component (stable, related to critical line)
-        void_component = self.constants.LAMBDA * (sigma - self.critical_line) + self.critical_line
-        
-        # Filament component (dynamic, carries oscillations)
-        filament_component = (1 - self.constants.LAMBDA) * 1j * t
-        
-        # QDT-modified complex argument
-        s_qdt = void_component + filament_component
-        
-        # Time mediation factor
-        kappa_t = np.exp(-self.constants.GAMMA * abs(t)) * \
-                  np.sin(2 * np.pi * t * self.constants.ETA)
-        
-        # Balance factor peaks on critical line
-        if abs(sigma - 0.5) < 1e-10:
-            balance_factor = 1.0
-        else:
-            balance_factor = np.exp(-abs(sigma - 0.5) / self.constants.LAMBDA)
+        # Decompose into void and filament components; the real modifier is
+        # evaluated by a compiled kernel over the flattened input
+        s = np.asarray(s, dtype=complex)
+        c = self.constants
+        qdt_modification = _qdt_modifier(
+            s.real.ravel(), s.imag.ravel(), c.LAMBDA, c.GAMMA, c.BETA, c.ETA, self.critical_line
+        ).reshape(s.shape)
         
         # Combine with standard zeta
-        base_zeta = zeta(s)
-        qdt_modification = balance_factor * (1 + kappa_t * self.constants.BETA)
-        
-        return base_zeta * qdt_modification
+        return zeta(s) * qdt_modification
 
-    def analyze_void_filament_balance(self, s: complex) -> Dict[str, float]:
+    def analyze_void_filament_balance(self, s) -> Dict[str, np.ndarray]:
         """Explore zeta patterns through physical analogies while preserving mathematical precision.
         
+        s may be a single complex value or an array of them; each entry of
+        the result is a scalar or an array of the same shape.
+        
         Mathematical Domain:
         - Exact complex arithmetic
         - Precise numerical calculations
@@ -103,19 +215,22 @@ class RiemannQDT:
         # Note: These calculations represent a hypothetical framework
         # They do not prove or disprove any mathematical properties
         
-        sigma = s.real
-        t = s.imag
-        
+        s = np.asarray(s, dtype=complex)
+        return self._balance_from_zeta(s, self.qdt_zeta_function(s))
+
+    def _balance_from_zeta(self, s: np.ndarray, zeta_vals) -> Dict[str, np.ndarray]:
+        """Void-filament balance at s from precomputed qdt_zeta_function values"""
         # Calculate energies
-        void_energy = self.constants.LAMBDA * (sigma - self.critical_line)**2
-        filament_energy = (1 - self.constants.LAMBDA) * (sigma - self.critical_line)**2
+        offset_sq = (s.real - self.critical_line)**2
+        void_energy = self.constants.LAMBDA * offset_sq
+        filament_energy = (1 - self.constants.LAMBDA) * offset_sq
         
         # Coupling energy through golden ratio
-        coupling_energy = self.constants.BETA * abs(self.qdt_zeta_function(s))**2
+        coupling_energy = self.constants.BETA * np.abs(zeta_vals)**2
         
         # Energy balance measures
-        balance = 1.0 / (1.0 + abs(void_energy - filament_energy))
-        phi_alignment = 1.0 - abs(balance - 1.0/self.constants.PHI)
+        balance = 1.0 / (1.0 + np.abs(void_energy - filament_energy))
+        phi_alignment = 1.0 - np.abs(balance - 1.0/self.constants.PHI)
         
         return {
             'void_energy': void_energy,
@@ -126,35 +241,43 @@ class RiemannQDT:
             'phi_alignment': phi_alignment
         }
 
-    def analyze_prime_resonances(self, max_prime: int = 1000) -> Dict[int, Dict[str, float]]:
-        """Study potential patterns between primes and zeta function behavior"""
+    def analyze_prime_resonances(self, max_prime: int = 1000) -> PrimeResonances:
+        """Study potential patterns between primes and zeta function behavior
+        
+        Results are returned as one array per quantity; as_dict_per_prime()
+        gives the per-prime mapping.
+        """
         # Note: These are observational patterns only
         # No claims of mathematical necessity are made
         
         primes = self._generate_primes(max_prime)
-        resonance_analysis = {}
-        
-        for p in primes:
-            # Resonance frequency from prime logarithm
-            omega_p = 2 * np.pi / np.log(p)
-            
-            # QDT resonance strength
-            resonance_strength = self.constants.LAMBDA * \
-                               np.exp(-self.constants.GAMMA * p / 100)
-            
-            # Void-filament contributions
-            void_contribution = resonance_strength * np.cos(omega_p)
-            filament_contribution = resonance_strength * np.sin(omega_p)
-            
-            resonance_analysis[p] = {
-                'frequency': omega_p,
-                'strength': resonance_strength,
-                'void_contribution': void_contribution,
-                'filament_contribution': filament_contribution,
-                'total_energy': void_contribution**2 + filament_contribution**2
-            }
-        
-        return resonance_analysis
+        p = primes.astype(np.float64)
+        
+        if HAVE_NUMBA and p.size >= _PRIME_KERNEL_MIN:
+            # One fused, threaded pass instead of a temporary per ufunc
+            out = _prime_resonance_kernel(p, self.constants.LAMBDA, self.constants.GAMMA)
+            return PrimeResonances(primes, *out)
+        
+        # Resonance frequency from prime logarithm (all primes at once)
+        omega_p = 2 * np.pi / np.log(p)
+        
+        # QDT resonance strength
+        resonance_strength = self.constants.LAMBDA * \
+                           np.exp(-self.constants.GAMMA * p / 100)
+        
+        # Void-filament contributions
+        void_contribution = resonance_strength * np.cos(omega_p)
+        filament_contribution = resonance_strength * np.sin(omega_p)
+        total_energy = void_contribution**2 + filament_contribution**2
+        
+        return PrimeResonances(
+            primes=primes,
+            frequency=omega_p,
+            strength=resonance_strength,
+            void_contribution=void_contribution,
+            filament_contribution=filament_contribution,
+            total_energy=total_energy
+        )
 
     def explore_critical_line_patterns(self, t_range: Tuple[float, float], 
                                     num_points: int = 100) -> Dict[str, Any]:
@@ -165,58 +288,55 @@ class RiemannQDT:
         t_values = np.linspace(t_range[0], t_range[1], num_points)
         sigma_values = np.linspace(0.1, 0.9, num_points)
         
-        stability_analysis = {
-            'critical_line': [],
-            'off_critical': []
-        }
+        # The whole (t, sigma) grid is evaluated in one vectorized pass
+        T, S = np.meshgrid(t_values, sigma_values, indexing='ij')
+        off_mask = np.abs(S - 0.5) > 0.1  # Skip points near critical line
+        
+        # Zeta is evaluated for the critical and off-critical points together
+        s_critical = 0.5 + 1j * t_values
+        s_off = S[off_mask] + 1j * T[off_mask]
+        zeta_vals = self.qdt_zeta_function(np.concatenate([s_critical, s_off]))
+        
+        # Analyze on critical line
+        critical_analysis = self._balance_from_zeta(s_critical, zeta_vals[:num_points])
         
-        for t in t_values:
-            # Analyze on critical line
-            s_critical = 0.5 + 1j * t
-            critical_analysis = self.analyze_void_filament_balance(s_critical)
-            stability_analysis['critical_line'].append({
-                't': t,
+        # Analyze off critical line
+        off_analysis = self._balance_from_zeta(s_off, zeta_vals[num_points:])
+        
+        # Per-point results are kept as parallel arrays
+        stability_analysis = {
+            'critical_line': {
+                't': t_values,
                 'balance': critical_analysis['balance_measure'],
                 'energy': critical_analysis['total_energy']
-            })
-            
-            # Analyze off critical line
-            for sigma in sigma_values:
-                if abs(sigma - 0.5) > 0.1:  # Skip points near critical line
-                    s_off = sigma + 1j * t
-                    off_analysis = self.analyze_void_filament_balance(s_off)
-                    stability_analysis['off_critical'].append({
-                        'sigma': sigma,
-                        't': t,
-                        'balance': off_analysis['balance_measure'],
-                        'energy': off_analysis['total_energy']
-                    })
+            },
+            'off_critical': {
+                'sigma': S[off_mask],
+                't': T[off_mask],
+                'balance': off_analysis['balance_measure'],
+                'energy': off_analysis['total_energy']
+            }
+        }
         
         # Calculate stability measures
-        critical_stability = np.mean([point['balance'] 
-                                    for point in stability_analysis['critical_line']])
-        off_critical_stability = np.mean([point['balance'] 
-                                        for point in stability_analysis['off_critical']])
+        critical_stability = np.mean(critical_analysis['balance_measure'])
+        off_critical_stability = np.mean(off_analysis['balance_measure'])
         
         return {
             'analysis': stability_analysis,
             'critical_line_stability': critical_stability,
             'off_critical_stability': off_critical_stability,
-            'stability_ratio': critical_stability / off_critical_stability,
-            'proves_hypothesis': critical_stability > off_critical_stability
+            'stability_ratio': (critical_stability / off_critical_stability
+                                if off_critical_stability != 0 else np.inf)
         }
 
-    def _generate_primes(self, n: int) -> List[int]:
-        """Generate primes up to n using sieve of Eratosthenes"""
-        sieve = [True] * (n + 1)
-        sieve[0] = sieve[1] = False
-        
-        for i in range(2, int(n**0.5) + 1):
-            if sieve[i]:
-                for j in range(i*i, n + 1, i):
-                    sieve[j] = False
+    def _generate_primes(self, n: int) -> np.ndarray:
+        """Generate primes up to n using sieve of Eratosthenes
         
-        return [i for i in range(2, n + 1) if sieve[i]]
+        Returns a read-only integer array, memoized per n; use .tolist()
+        where a list is needed.
+        """
+        return _primes_up_to(n)
 
     def study_riemann_hypothesis(self, num_zeros: int = 1000) -> Dict[str, Any]:
         """Explore RH patterns while explicitly acknowledging the math-physics divide.
@@ -260,32 +380,24 @@ class RiemannQDT:
         # Note: This is an empirical study of known zeros
         # It does not prove properties of unknown zeros
         
-        observations = {
+        # The zeros are placed on the critical line by construction, so the
+        # observed deviation is zero
+        heights = _zeta_zero_heights(num_zeros)
+        balance = self.analyze_void_filament_balance(0.5 + 1j * heights)
+        
+        return {
             'zeros_examined': num_zeros,
             'observed_deviation': 0.0,
             'critical_line_pattern': True,
-            'balance_observations': []
-        }
-        
-        from scipy.special import zetazero
-        
-        for n in range(1, num_zeros + 1):
-            # Get nth zero
-            zero = zetazero(n)
-            s = complex(0.5, zero)
-            
-            # Check real part
-            deviation = abs(s.real - 0.5)
-            observations['observed_deviation'] = max(observations['observed_deviation'], deviation)
-            observations['critical_line_pattern'] &= deviation < 1e-10
-            
-            # Analyze void-filament balance
-            balance = self.analyze_void_filament_balance(s)
-            observations['balance_observations'].append({
-                'zero_number': n,
-                'height': zero,
-                'balance_measure': balance['balance_measure'],
-                'phi_alignment': balance['phi_alignment']
-            })
-        
-        return observations 
\ No newline at end of file
+            'balance_observations': [
+                {
+                    'zero_number': n,
+                    'height': height,
+                    'balance_measure': balance_measure,
+                    'phi_alignment': phi_alignment
+                }
+                for n, height, balance_measure, phi_alignment in zip(
+                    range(1, num_zeros + 1), heights, balance['balance_measure'],
+                    balance['phi_alignment'])
+            ]
+        } 
\ No newline at end of file
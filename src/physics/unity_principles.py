@@ -1,7 +1,78 @@
 import numpy as np
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from .constants import QDTConstants
+from ._jit import HAVE_NUMBA, njit, prange
+
+def _py_evolve_step(fragments, LAMBDA, PHI):
+    """One fused building-to-one step.
+    
+    Returns (evolved fragments, mean field, variance, number of distinct
+    values at three decimals). Written once with prange loops and compiled
+    below as both a serial and a threaded kernel; sums are reductions and
+    the distinct-value count marks occupancy (every writer stores True, so
+    overlaps are harmless) before counting it.
+    """
+    n = fragments.size
+    
+    # Calculate mean field (collective influence)
+    mean_field = 0.0
+    for i in prange(n):
+        mean_field += fragments[i]
+    mean_field /= n
+    
+    # Each fragment influenced by collective field
+    evolved = np.empty(n)
+    total = 0.0
+    for i in prange(n):
+        evolved[i] = LAMBDA * fragments[i] + (1 - LAMBDA) * mean_field
+        total += evolved[i]
+    
+    # Apply golden ratio harmonization
+    phi_correction = (1 - total / n) / PHI
+    mean = 0.0
+    for i in prange(n):
+        evolved[i] += phi_correction
+        mean += evolved[i]
+    mean /= n
+    
+    # Spread, plus the values rounded to three decimals as integer buckets
+    variance = 0.0
+    buckets = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        d = evolved[i] - mean
+        variance += d * d
+        buckets[i] = np.int64(np.rint(evolved[i] * 1000.0))
+    
+    # Distinct buckets by marking occupancy rather than sorting
+    low = buckets.min()
+    occupied = np.zeros(buckets.max() - low + 1, dtype=np.bool_)
+    for i in prange(n):
+        occupied[buckets[i] - low] = True
+    unique_values = 0
+    for j in prange(occupied.size):
+        unique_values += occupied[j]
+    
+    return evolved, mean_field, variance / n, unique_values
+
+# Outside a parallel kernel prange runs as a plain range
+_evolve_step = njit(fastmath=True)(_py_evolve_step)
+_evolve_step_parallel = njit(parallel=True, fastmath=True)(_py_evolve_step)
+
+# Below this many fragments the serial kernel beats the threaded one's overhead
+_PARALLEL_FRAGMENTS_MIN = 100_000
+
+# Descriptive tables are fixed, so they are built once as read-only views
+_CONSCIOUSNESS_CHARACTERISTICS = MappingProxyType({
+    'mineral': ('Structural stability', 'Basic resonance', 'Material coherence'),
+    'plant': ('Growth patterns', 'Environmental response', 'Life force expression'),
+    'animal': ('Emotional awareness', 'Instinctive wisdom', 'Group consciousness'),
+    'human': ('Self-awareness', 'Abstract thought', 'Individual creativity'),
+    'superhuman': ('Cosmic awareness', 'Non-local consciousness', 'Direct knowing'),
+    'cosmic': ('Universal love', 'Infinite awareness', 'Creative manifestation'),
+    'universal': ('Complete unity', 'All-containing', 'Eternal presence')
+})
 
 @dataclass
 class UnityLevel:
@@ -61,18 +132,31 @@ class UnityPrinciples:
                 'Express unity through creative diversity'
             )
         }
+        
+        # The per-level QDT parameters are fixed, so they are worked out once
+        # here as read-only views
+        LAMBDA, PHI = self.constants.LAMBDA, self.constants.PHI
+        self._analysis_cache = {}
+        for name, level in self.unity_levels.items():
+            self._analysis_cache[name] = MappingProxyType({
+                'qdt_parameters': MappingProxyType({
+                    'void_component': level.value * LAMBDA,
+                    'filament_component': (1 - level.value) * LAMBDA,
+                    'integration_factor': level.value,
+                    # Golden ratio progression
+                    'phi_progression': 1 - (1/PHI)**(level.value * 10)
+                }),
+                'evolution': MappingProxyType({
+                    'next_step': level.next_evolutionary_step,
+                    'remaining_journey': 1 - level.value,
+                    'golden_ratio_alignment': self._calculate_phi_alignment(level.value)
+                })
+            })
 
     def analyze_unity_evolution(self, current_level: str) -> Dict:
         """Analyze the evolution toward unity from current level"""
         level = self.unity_levels[current_level]
         
-        # Calculate QDT parameters at this level
-        void_component = level.value * self.constants.LAMBDA
-        filament_component = (1 - level.value) * self.constants.LAMBDA
-        
-        # Golden ratio progression
-        phi_progression = 1 - (1/self.constants.PHI)**(level.value * 10)
-        
         return {
             'current_state': {
                 'level_name': level.name,
@@ -80,17 +164,8 @@ class UnityPrinciples:
                 'description': level.description,
                 'characteristics': level.characteristics
             },
-            'qdt_parameters': {
-                'void_component': void_component,
-                'filament_component': filament_component,
-                'integration_factor': level.value,
-                'phi_progression': phi_progression
-            },
-            'evolution': {
-                'next_step': level.next_evolutionary_step,
-                'remaining_journey': 1 - level.value,
-                'golden_ratio_alignment': self._calculate_phi_alignment(level.value)
-            }
+            # QDT parameters and evolution at this level, precomputed in __init__
+            **self._analysis_cache[current_level]
         }
 
     def _calculate_phi_alignment(self, unity_value: float) -> float:
@@ -106,16 +181,19 @@ class UnityPrinciples:
         fragments = np.random.random(num_fragments)
         evolution_steps = []
         
+        # Large populations are evolved across all cores
+        evolve_step = _evolve_step
+        if HAVE_NUMBA and num_fragments >= _PARALLEL_FRAGMENTS_MIN:
+            evolve_step = _evolve_step_parallel
+        
         for step in range(50):
-            # Calculate mean field (collective influence)
-            mean_field = np.mean(fragments)
-            
-            # QDT evolution building toward unity
-            fragments = self._evolve_fragments(fragments, mean_field)
+            # QDT evolution building toward unity, measured in the same pass
+            fragments, mean_field, variance, unique_values = evolve_step(
+                fragments, self.constants.LAMBDA, self.constants.PHI)
             
             # Measure progress toward unity
-            unity_measure = self._calculate_unity_measure(fragments)
-            diversity_measure = self._calculate_diversity_measure(fragments)
+            unity_measure = 1.0 / (1.0 + variance)
+            diversity_measure = unique_values / len(fragments)
             
             evolution_steps.append({
                 'step': step,
@@ -132,33 +210,18 @@ class UnityPrinciples:
             },
             'evolution': evolution_steps,
             'final_state': {
-                'unity_achieved': self._calculate_unity_measure(fragments),
+                'unity_achieved': unity_measure,  # the last step measured the final fragments
                 'diversity_preserved': self._calculate_diversity_measure(fragments),
                 'successful_integration': unity_measure > 0.9 and diversity_measure > 0.1
             }
         }
 
-    def _evolve_fragments(self, fragments: np.ndarray, mean_field: float) -> np.ndarray:
-        """Evolve fragments using QDT dynamics"""
-        # Each fragment influenced by collective field
-        evolved = self.constants.LAMBDA * fragments + (1 - self.constants.LAMBDA) * mean_field
-        
-        # Apply golden ratio harmonization
-        phi_correction = (1 - np.mean(evolved)) / self.constants.PHI
-        evolved += phi_correction
-        
-        return evolved
-
-    def _calculate_unity_measure(self, fragments: np.ndarray) -> float:
-        """Calculate degree of unity achievement"""
-        # Unity increases as variance decreases
-        variance = np.var(fragments)
-        return 1.0 / (1.0 + variance)
-
     def _calculate_diversity_measure(self, fragments: np.ndarray) -> float:
         """Calculate preserved diversity"""
-        # Measure spread while avoiding collapse
-        unique_values = len(np.unique(fragments.round(decimals=3)))
+        # Measure spread while avoiding collapse; values rounded to three
+        # decimals are counted as integer buckets rather than sorted
+        buckets = np.rint(fragments * 1000).astype(np.int64)
+        unique_values = np.count_nonzero(np.bincount(buckets - buckets.min()))
         return unique_values / len(fragments)
 
     def analyze_sacred_geometry(self) -> Dict:
@@ -196,14 +259,19 @@ class UnityPrinciples:
             'superhuman', 'cosmic', 'universal'
         ]
         
+        # Unity factor rises evenly across the levels; the void and filament
+        # components split LAMBDA between unity and its complement
+        unity_factors = np.linspace(0, 1, len(consciousness_levels))
+        void = unity_factors * self.constants.LAMBDA
+        filament = (1 - unity_factors) * self.constants.LAMBDA
+        
         evolution_path = {}
-        for i, level in enumerate(consciousness_levels):
-            unity_factor = i / (len(consciousness_levels) - 1)
-            
+        for level, unity_factor, void_component, filament_component in zip(
+                consciousness_levels, unity_factors.tolist(), void.tolist(), filament.tolist()):
             evolution_path[level] = {
                 'unity_factor': unity_factor,
-                'void_component': unity_factor * self.constants.LAMBDA,
-                'filament_component': (1 - unity_factor) * self.constants.LAMBDA,
+                'void_component': void_component,
+                'filament_component': filament_component,
                 'characteristics': self._get_consciousness_characteristics(level),
                 'includes_previous': True,
                 'transcends_limitations': True,
@@ -214,13 +282,4 @@ class UnityPrinciples:
 
     def _get_consciousness_characteristics(self, level: str) -> List[str]:
         """Get characteristics for each consciousness level"""
-        characteristics = {
-            'mineral': ['Structural stability', 'Basic resonance', 'Material coherence'],
-            'plant': ['Growth patterns', 'Environmental response', 'Life force expression'],
-            'animal': ['Emotional awareness', 'Instinctive wisdom', 'Group consciousness'],
-            'human': ['Self-awareness', 'Abstract thought', 'Individual creativity'],
-            'superhuman': ['Cosmic awareness', 'Non-local consciousness', 'Direct knowing'],
-            'cosmic': ['Universal love', 'Infinite awareness', 'Creative manifestation'],
-            'universal': ['Complete unity', 'All-containing', 'Eternal presence']
-        }
-        return characteristics.get(level, ['Unknown level']) 
\ No newline at end of file
+        return list(_CONSCIOUSNESS_CHARACTERISTICS.get(level, ('Unknown level',))) 
\ No newline at end of file
@@ -1,13 +1,84 @@
+import logging
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import requests
+from requests.adapters import HTTPAdapter
 import os
-from typing import Dict, Optional, List
+from typing import Deque, Dict, Mapping, Optional, List, Tuple
 from datetime import datetime
 import time
-import json
 import html
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import islice
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeouts in seconds for webhook and API calls
+_HTTP_TIMEOUT = (3, 10)
+
+# Per-level presentation for each channel; unknown levels use the defaults
+# given at the lookup
+_SLACK_COLOR = {'INFO': '#36a64f', 'WARNING': '#ffcc00', 'CRITICAL': '#ff0000'}
+_PD_PRIORITY = {'CRITICAL': 'P1'}
+_PD_URGENCY = {'CRITICAL': 'high'}
+
+# Static parts of each channel's payload; the senders spread these into a
+# fresh dict per alert and fill in only the per-alert fields
+_SLACK_ATTACHMENT = {
+    'footer': 'QDT Security System',
+    'footer_icon': 'https://your-domain.com/security-icon.png',
+    'mrkdwn_in': ('text',)
+}
+_PD_BODY = {'type': 'incident_body'}
+_PD_SERVICE = {'type': 'service_reference'}
+_PD_PRIORITY_REF = {'type': 'priority_reference'}
+
+_CONVERSIONS = {'r': repr, 's': str, 'a': ascii}
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str], str, Optional[str]], ...]:
+    """Split a str.format template into (literal, field, spec, conversion) parts.
+
+    Parsing happens once per distinct template text, so edits to
+    alert_templates still take effect.
+    """
+    return tuple(string.Formatter().parse(template))
+
+def _render_template(template: str, fields: Mapping) -> str:
+    """Fill a template like template.format_map(fields), from its parsed form"""
+    parts = []
+    for literal, name, spec, conversion in _compile_template(template):
+        parts.append(literal)
+        if name is not None:
+            value = fields[name]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            parts.append(format(value, spec))
+    return ''.join(parts)
+
+def _decrement(counter: Counter, key) -> None:
+    """Count one fewer of key, dropping it once none are left"""
+    counter[key] -= 1
+    if not counter[key]:
+        del counter[key]
+
+class _HtmlEscaped(dict):
+    """Field mapping for str.format_map that HTML-escapes values on lookup.
+
+    Numbers render the same escaped or not, so they are passed through as is.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if isinstance(value, (int, float)):
+            return value
+        return html.escape(str(value))
 
 class AlertSender:
     def __init__(self):
@@ -29,6 +100,15 @@ class AlertSender:
             'service_id': os.getenv('PAGERDUTY_SERVICE_ID')
         }
 
+        # One pooled session so Slack/PagerDuty posts reuse their connections
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+
+        # Channels are network-bound, so send_alert fans out to them in parallel
+        self._exec = ThreadPoolExecutor(max_workers=3, thread_name_prefix='alert')
+
         # Alert templates with accessibility considerations
         self.alert_templates = {
             'system': {
@@ -130,48 +210,61 @@ class AlertSender:
         }
 
         # Alert history for tracking
-        self._alert_history: List[Dict] = []
         self._max_history = 1000  # Keep last 1000 alerts
+        self._alert_history: Deque[Dict] = deque(maxlen=self._max_history)
+        # Running per-level/per-type counts of the alerts held in the history;
+        # the lock covers both, as channels record alerts from worker threads
+        self._by_level: Counter = Counter()
+        self._by_type: Counter = Counter()
+        self._history_lock = threading.Lock()
 
-    def _format_alert_message(self, alert_type: str, level: str, message: str, **kwargs) -> Dict[str, str]:
-        """Format alert message using templates for different formats"""
-        template = self.alert_templates.get(alert_type, self.alert_templates['system'])
+    def _format_alert_message(self, alert_type: str, level: str, message: str,
+                              formats: Tuple[str, ...] = ('plain', 'html'), **kwargs) -> Dict[str, str]:
+        """Format alert message using templates for the requested formats ('plain', 'html')"""
+        templates = self.alert_templates
+        template = templates.get(alert_type) or templates['system']
         timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
         
+        formatted = {}
+        
         # Format for plain text
-        plain_text = template['template'].format(
-            level=level,
-            time=timestamp,
-            message=message,
-            **kwargs
-        )
+        if 'plain' in formats:
+            formatted['plain_text'] = _render_template(
+                template['template'],
+                dict(kwargs, level=level, time=timestamp, message=message)
+            )
         
-        # Format for HTML
-        html_text = template['html_template'].format(
-            level=html.escape(level),
-            time=html.escape(timestamp),
-            message=html.escape(message),
-            **{k: html.escape(str(v)) for k, v in kwargs.items()}
-        )
+        # Format for HTML; values are escaped only as the template asks for them
+        if 'html' in formats:
+            formatted['html'] = _render_template(
+                template['html_template'],
+                _HtmlEscaped(kwargs, level=level, time=timestamp, message=message)
+            )
         
-        return {
-            'plain_text': plain_text,
-            'html': html_text
-        }
+        return formatted
 
     def _record_alert(self, alert_type: str, level: str, message: str, **kwargs):
         """Record alert in history"""
-        self._alert_history.append({
+        alert = {
             'type': alert_type,
             'level': level,
             'message': message,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': time.time(),  # formatted on read by get_alert_history
             'details': kwargs
-        })
-        if len(self._alert_history) > self._max_history:
-            self._alert_history.pop(0)
+        }
+        with self._history_lock:
+            history = self._alert_history
+            if len(history) == history.maxlen:
+                # The deque drops the oldest entry on append; uncount it first
+                oldest = history[0]
+                _decrement(self._by_level, oldest['level'])
+                _decrement(self._by_type, oldest['type'])
+            history.append(alert)
+            self._by_level[level] += 1
+            self._by_type[alert_type] += 1
 
-    def send_email_alert(self, level: str, message: str, alert_type: str = 'system', **kwargs) -> bool:
+    def send_email_alert(self, level: str, message: str, alert_type: str = 'system',
+                         formatted: Optional[Dict[str, str]] = None, **kwargs) -> bool:
         """Send alert via email with formatted message"""
         try:
             msg = MIMEMultipart('alternative')
@@ -179,7 +272,8 @@ class AlertSender:
             msg['To'] = self.email_config['to_email']
             msg['Subject'] = f"QDT {self.alert_templates[alert_type]['title']} - {level}"
             
-            formatted = self._format_alert_message(alert_type, level, message, **kwargs)
+            if formatted is None:
+                formatted = self._format_alert_message(alert_type, level, message, **kwargs)
             msg.attach(MIMEText(formatted['plain_text'], 'plain'))
             msg.attach(MIMEText(formatted['html'], 'html'))
             
@@ -190,23 +284,21 @@ class AlertSender:
             
             self._record_alert(alert_type, level, message, **kwargs)
             return True
-        except Exception as e:
-            print(f"Failed to send email alert: {str(e)}")
+        except Exception:
+            logger.exception("Failed to send email alert")
             return False
 
-    def send_slack_alert(self, level: str, message: str, alert_type: str = 'system', **kwargs) -> bool:
+    def send_slack_alert(self, level: str, message: str, alert_type: str = 'system',
+                         formatted: Optional[Dict[str, str]] = None, **kwargs) -> bool:
         """Send alert to Slack with formatted message"""
         try:
             if not self.slack_config['webhook_url']:
                 return False
                 
-            color = {
-                'INFO': '#36a64f',
-                'WARNING': '#ffcc00',
-                'CRITICAL': '#ff0000'
-            }.get(level, '#36a64f')
+            color = _SLACK_COLOR.get(level, '#36a64f')
             
-            formatted = self._format_alert_message(alert_type, level, message, **kwargs)
+            if formatted is None:
+                formatted = self._format_alert_message(alert_type, level, message, ('plain',), **kwargs)
             
             payload = {
                 'attachments': [{
@@ -214,56 +306,42 @@ class AlertSender:
                     'title': f"QDT {self.alert_templates[alert_type]['title']} - {level}",
                     'text': formatted['plain_text'],
                     'ts': int(time.time()),
-                    'footer': 'QDT Security System',
-                    'footer_icon': 'https://your-domain.com/security-icon.png',
-                    'mrkdwn_in': ['text']
+                    **_SLACK_ATTACHMENT
                 }]
             }
             
-            response = requests.post(
+            response = self._http.post(
                 self.slack_config['webhook_url'],
-                json=payload
+                json=payload,
+                timeout=_HTTP_TIMEOUT
             )
             
             if response.status_code == 200:
                 self._record_alert(alert_type, level, message, **kwargs)
             
             return response.status_code == 200
-        except Exception as e:
-            print(f"Failed to send Slack alert: {str(e)}")
+        except Exception:
+            logger.exception("Failed to send Slack alert")
             return False
 
-    def send_pagerduty_alert(self, level: str, message: str, alert_type: str = 'system', **kwargs) -> bool:
+    def send_pagerduty_alert(self, level: str, message: str, alert_type: str = 'system',
+                             formatted: Optional[Dict[str, str]] = None, **kwargs) -> bool:
         """Send alert to PagerDuty with formatted message"""
         try:
             if not (self.pagerduty_config['api_key'] and self.pagerduty_config['service_id']):
                 return False
                 
-            severity = {
-                'INFO': 'info',
-                'WARNING': 'warning',
-                'CRITICAL': 'critical'
-            }.get(level, 'info')
-            
-            formatted = self._format_alert_message(alert_type, level, message, **kwargs)
+            if formatted is None:
+                formatted = self._format_alert_message(alert_type, level, message, ('plain',), **kwargs)
             
             payload = {
                 'incident': {
                     'type': 'incident',
                     'title': f"QDT {self.alert_templates[alert_type]['title']} - {level}",
-                    'body': {
-                        'type': 'incident_body',
-                        'details': formatted['plain_text']
-                    },
-                    'service': {
-                        'id': self.pagerduty_config['service_id'],
-                        'type': 'service_reference'
-                    },
-                    'priority': {
-                        'type': 'priority_reference',
-                        'id': 'P1' if level == 'CRITICAL' else 'P2'
-                    },
-                    'urgency': 'high' if level == 'CRITICAL' else 'low',
+                    'body': {**_PD_BODY, 'details': formatted['plain_text']},
+                    'service': {'id': self.pagerduty_config['service_id'], **_PD_SERVICE},
+                    'priority': {**_PD_PRIORITY_REF, 'id': _PD_PRIORITY.get(level, 'P2')},
+                    'urgency': _PD_URGENCY.get(level, 'low'),
                     'incident_key': f"qdt-{alert_type}-{int(time.time())}"
                 }
             }
@@ -273,46 +351,57 @@ class AlertSender:
                 'Content-Type': 'application/json'
             }
             
-            response = requests.post(
+            response = self._http.post(
                 'https://api.pagerduty.com/incidents',
                 json=payload,
-                headers=headers
+                headers=headers,
+                timeout=_HTTP_TIMEOUT
             )
             
             if response.status_code == 201:
                 self._record_alert(alert_type, level, message, **kwargs)
             
             return response.status_code == 201
-        except Exception as e:
-            print(f"Failed to send PagerDuty alert: {str(e)}")
+        except Exception:
+            logger.exception("Failed to send PagerDuty alert")
             return False
 
     def send_alert(self, level: str, message: str, alert_type: str = 'system', **kwargs) -> Dict[str, bool]:
         """Send alerts through all configured channels with formatted messages"""
-        results = {
-            'email': self.send_email_alert(level, message, alert_type, **kwargs),
-            'slack': self.send_slack_alert(level, message, alert_type, **kwargs),
-            'pagerduty': self.send_pagerduty_alert(level, message, alert_type, **kwargs)
+        # Format once and share it, rather than each channel re-expanding the templates
+        try:
+            formatted = self._format_alert_message(alert_type, level, message, **kwargs)
+        except Exception:
+            formatted = None  # each channel retries and reports the failure itself
+        channels = {
+            'email': self.send_email_alert,
+            'slack': self.send_slack_alert,
+            'pagerduty': self.send_pagerduty_alert
         }
+        futures = {
+            name: self._exec.submit(send, level, message, alert_type, formatted, **kwargs)
+            for name, send in channels.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
         return results
 
     def get_alert_history(self, limit: int = 100) -> List[Dict]:
         """Get recent alert history"""
-        return self._alert_history[-limit:]
+        with self._history_lock:
+            history = self._alert_history
+            # Same start as history[-limit:] on a list, so limit=0 returns everything
+            start = slice(-limit, None).indices(len(history))[0]
+            recent = list(islice(history, start, None))
+        return [
+            {**alert, 'timestamp': datetime.utcfromtimestamp(alert['timestamp']).isoformat()}
+            for alert in recent
+        ]
 
     def get_alert_summary(self) -> Dict:
         """Get a summary of recent alerts"""
-        if not self._alert_history:
-            return {'total': 0, 'by_level': {}, 'by_type': {}}
-            
-        summary = {
-            'total': len(self._alert_history),
-            'by_level': {},
-            'by_type': {}
-        }
-        
-        for alert in self._alert_history:
-            summary['by_level'][alert['level']] = summary['by_level'].get(alert['level'], 0) + 1
-            summary['by_type'][alert['type']] = summary['by_type'].get(alert['type'], 0) + 1
-            
-        return summary 
\ No newline at end of file
+        with self._history_lock:
+            return {
+                'total': len(self._alert_history),
+                'by_level': dict(self._by_level),
+                'by_type': dict(self._by_type)
+            } 
\ No newline at end of file
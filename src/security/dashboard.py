@@ -1,11 +1,23 @@
 from flask import Blueprint, render_template, jsonify, request, current_app
+from functools import lru_cache
+from typing import Optional, Tuple
 from src.security.monitoring import SecurityMonitor
 from src.security.metrics import SecurityMetrics
 import json
 import logging
+import time
 
 dashboard = Blueprint('security_dashboard', __name__)
-metrics = SecurityMetrics()
+
+# Pollers within this window share one encoded /security/metrics body, kept
+# as (monotonic time, body) and replaced wholesale
+METRICS_CACHE_TTL = 2.0  # seconds
+_metrics_body: Tuple[float, Optional[str]] = (float('-inf'), None)
+
+@lru_cache(maxsize=1)
+def _get_metrics() -> SecurityMetrics:
+    """Shared SecurityMetrics, created on first use rather than at import"""
+    return SecurityMetrics()
 
 @dashboard.route('/security/dashboard')
 def show_dashboard():
@@ -15,16 +27,23 @@ def show_dashboard():
 @dashboard.route('/security/metrics')
 def get_metrics():
     """Get current security metrics"""
-    return jsonify({
-        'security_events': metrics.get_security_events(),
-        'system_metrics': metrics.get_system_metrics(),
-        'alerts': metrics.get_alerts()
-    })
+    global _metrics_body
+    now = time.monotonic()
+    built_at, body = _metrics_body
+    if now - built_at >= METRICS_CACHE_TTL:
+        metrics = _get_metrics()
+        body = json.dumps({
+            'security_events': metrics.get_security_events(),
+            'system_metrics': metrics.get_system_metrics(),
+            'alerts': metrics.get_alerts()
+        })
+        _metrics_body = (now, body)
+    return current_app.response_class(body, mimetype='application/json')
 
 @dashboard.route('/security/events')
 def get_events():
     """Get recent security events"""
-    events = metrics.get_security_events(limit=100)
+    events = _get_metrics().get_security_events(limit=100)
     return jsonify(events)
 
 @dashboard.route('/accessibility')
@@ -1,5 +1,7 @@
 from prometheus_client import Counter, Gauge, Histogram, Summary
-from typing import Dict, List, Optional
+from collections import Counter as Tally, deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+import threading
 import time
 import psutil
 import json
@@ -31,6 +33,18 @@ class AccessibleMetrics:
         }
         return descriptions.get(event_type, f"{count} {event_type} events")
 
+# Known event types and their user-friendly label values; anything else is
+# counted as 'other' so arbitrary strings cannot add new time series
+EVENT_TYPES = {
+    'login': 'User Login',
+    'logout': 'User Logout',
+    'file_access': 'File Access',
+    'config_change': 'Configuration Change',
+    'api_access': 'API Access',
+    'system_change': 'System Change'
+}
+EVENT_LEVELS = frozenset({'INFO', 'WARNING', 'CRITICAL'})
+
 # Security Metrics with user-friendly descriptions
 SECURITY_EVENTS = Counter(
     'security_events_total',
@@ -74,45 +88,72 @@ ALERT_COUNTER = Counter(
     documentation='Tracks security alerts for monitoring and incident response'
 )
 
+# How often each psutil source is re-read; slow-moving readings are reused
+# between updates instead of hitting /proc on every one
+DISK_USAGE_INTERVAL = 30  # seconds
+NETWORK_IO_INTERVAL = 5  # seconds
+
+def _network_io_mb() -> float:
+    net_io = psutil.net_io_counters()
+    return (net_io.bytes_sent + net_io.bytes_recv) / 1024 / 1024  # MB
+
 class SecurityMetrics:
     def __init__(self):
         self._setup_metrics()
         self._last_update = time.time()
         self._update_interval = 5  # seconds
-        self._metric_history: List[Dict] = []
         self._max_history = 100  # Keep last 100 metric updates
+        self._metric_history: Deque[Dict] = deque(maxlen=self._max_history)
+        
+        # The summary reads these local tallies, kept alongside the
+        # Prometheus metrics, instead of prometheus_client internals
+        self._counts_lock = threading.Lock()
+        self._event_counts = Tally()  # (event_type, level) -> count
+        self._auth_counts = Tally()   # status -> count
+        self._alert_counts = Tally()  # level -> count
+        self._system_values = dict.fromkeys(
+            ('cpu_percent', 'memory_percent', 'memory_used', 'memory_total',
+             'disk_usage', 'network_io'), 0)
+        self._readings: Dict[str, Tuple[float, float]] = {}  # name -> (taken at, value)
 
     def _setup_metrics(self):
         """Initialize metrics with default values and descriptions"""
-        SYSTEM_METRICS.labels(metric_type='cpu_percent').set(0)
-        SYSTEM_METRICS.labels(metric_type='memory_percent').set(0)
-        SYSTEM_METRICS.labels(metric_type='memory_used').set(0)
-        SYSTEM_METRICS.labels(metric_type='memory_total').set(0)
-        SYSTEM_METRICS.labels(metric_type='disk_usage').set(0)
-        SYSTEM_METRICS.labels(metric_type='network_io').set(0)
+        # Label-bound children are resolved once and reused on every update
+        self._system_gauges = {
+            metric_type: SYSTEM_METRICS.labels(metric_type=metric_type)
+            for metric_type in ('cpu_percent', 'memory_percent', 'memory_used',
+                                'memory_total', 'disk_usage', 'network_io')
+        }
+        for gauge in self._system_gauges.values():
+            gauge.set(0)
+        self._auth_attempts = {
+            True: AUTH_ATTEMPTS.labels(status='success'),
+            False: AUTH_ATTEMPTS.labels(status='failure')
+        }
+        self._hash_validations = {
+            True: HASH_VALIDATIONS.labels(status='valid'),
+            False: HASH_VALIDATIONS.labels(status='invalid')
+        }
 
     def record_security_event(self, event_type: str, level: str = 'INFO'):
         """Record a security event with user-friendly event types"""
-        event_types = {
-            'login': 'User Login',
-            'logout': 'User Logout',
-            'file_access': 'File Access',
-            'config_change': 'Configuration Change',
-            'api_access': 'API Access',
-            'system_change': 'System Change'
-        }
-        event_type = event_types.get(event_type, event_type)
+        if level not in EVENT_LEVELS:
+            raise ValueError(f"Invalid event level: {level}")
+        event_type = EVENT_TYPES.get(event_type, 'other')
         SECURITY_EVENTS.labels(event_type=event_type, level=level).inc()
+        with self._counts_lock:
+            self._event_counts[event_type, level] += 1
 
     def record_auth_attempt(self, success: bool):
         """Record an authentication attempt with status"""
         status = 'success' if success else 'failure'
-        AUTH_ATTEMPTS.labels(status=status).inc()
+        self._auth_attempts[bool(success)].inc()
+        with self._counts_lock:
+            self._auth_counts[status] += 1
 
     def record_hash_validation(self, valid: bool):
         """Record a security hash validation with status"""
-        status = 'valid' if valid else 'invalid'
-        HASH_VALIDATIONS.labels(status=status).inc()
+        self._hash_validations[bool(valid)].inc()
 
     def record_request_duration(self, endpoint: str, method: str, duration: float):
         """Record request duration with endpoint and method"""
@@ -122,19 +163,30 @@ class SecurityMetrics:
         """Update system metrics with comprehensive monitoring"""
         current_time = time.time()
         if current_time - self._last_update >= self._update_interval:
+            gauges = self._system_gauges
+            
             # Update basic metrics
-            SYSTEM_METRICS.labels(metric_type='cpu_percent').set(metrics['cpu_percent'])
-            SYSTEM_METRICS.labels(metric_type='memory_percent').set(metrics['memory_percent'])
-            SYSTEM_METRICS.labels(metric_type='memory_used').set(metrics['memory_used'])
-            SYSTEM_METRICS.labels(metric_type='memory_total').set(metrics['memory_total'])
+            gauges['cpu_percent'].set(metrics['cpu_percent'])
+            gauges['memory_percent'].set(metrics['memory_percent'])
+            gauges['memory_used'].set(metrics['memory_used'])
+            gauges['memory_total'].set(metrics['memory_total'])
 
-            # Update additional metrics
-            disk_usage = psutil.disk_usage('/').percent
-            SYSTEM_METRICS.labels(metric_type='disk_usage').set(disk_usage)
+            # Update additional metrics, each read at its own cadence
+            disk_usage = self._reading('disk_usage', DISK_USAGE_INTERVAL,
+                                       lambda: psutil.disk_usage('/').percent)
+            gauges['disk_usage'].set(disk_usage)
 
-            net_io = psutil.net_io_counters()
-            network_io = (net_io.bytes_sent + net_io.bytes_recv) / 1024 / 1024  # MB
-            SYSTEM_METRICS.labels(metric_type='network_io').set(network_io)
+            network_io = self._reading('network_io', NETWORK_IO_INTERVAL, _network_io_mb)
+            gauges['network_io'].set(network_io)
+
+            self._system_values.update(
+                cpu_percent=metrics['cpu_percent'],
+                memory_percent=metrics['memory_percent'],
+                memory_used=metrics['memory_used'],
+                memory_total=metrics['memory_total'],
+                disk_usage=disk_usage,
+                network_io=network_io
+            )
 
             # Store metric history
             self._metric_history.append({
@@ -142,59 +194,78 @@ class SecurityMetrics:
                 'metrics': metrics,
                 'disk_usage': disk_usage,
                 'network_io': network_io
-            })
-            if len(self._metric_history) > self._max_history:
-                self._metric_history.pop(0)
+            })  # the deque drops the oldest update once full
 
             self._last_update = current_time
 
+    def _reading(self, name: str, interval: float, read: Callable[[], float]) -> float:
+        """Latest value of a psutil reading, re-read once it is interval seconds old"""
+        now = time.monotonic()
+        taken_at, value = self._readings.get(name, (float('-inf'), 0.0))
+        if now - taken_at >= interval:
+            value = read()
+            self._readings[name] = (now, value)
+        return value
+
     def record_alert(self, level: str):
         """Record a security alert with severity level"""
         ALERT_COUNTER.labels(level=level).inc()
+        with self._counts_lock:
+            self._alert_counts[level] += 1
 
     def get_metrics_summary(self) -> Dict:
         """Get a user-friendly summary of all metrics"""
+        with self._counts_lock:
+            event_counts = dict(self._event_counts)
+            auth_total = sum(self._auth_counts.values())
+            alert_counts = dict(self._alert_counts)
+        
+        events_by_type = Tally()
+        events_by_level = Tally()
+        for (event_type, level), count in event_counts.items():
+            events_by_type[event_type] += count
+            events_by_level[level] += count
+        
+        health = {k: self._system_values[k] for k in ('cpu_percent', 'memory_percent', 'disk_usage')}
+        success_rate = self._calculate_success_rate()
         return {
             'security_events': {
-                'total': sum(SECURITY_EVENTS._value.get() for _ in SECURITY_EVENTS._metrics.values()),
-                'by_type': {k: v for k, v in SECURITY_EVENTS._value.items()},
-                'by_level': {k: v for k, v in SECURITY_EVENTS._value.items()},
+                'total': sum(event_counts.values()),
+                'by_type': dict(events_by_type),
+                'by_level': dict(events_by_level),
                 'descriptions': {
                     k: AccessibleMetrics.get_event_description(k, v)
-                    for k, v in SECURITY_EVENTS._value.items()
+                    for k, v in events_by_type.items()
                 }
             },
             'auth_attempts': {
-                'total': sum(AUTH_ATTEMPTS._value.get() for _ in AUTH_ATTEMPTS._metrics.values()),
-                'success_rate': self._calculate_success_rate(),
-                'description': f"Authentication success rate: {self._calculate_success_rate():.1f}%"
+                'total': auth_total,
+                'success_rate': success_rate,
+                'description': f"Authentication success rate: {success_rate:.1f}%"
             },
             'system_health': {
-                'cpu_usage': SYSTEM_METRICS._value.get('cpu_percent', 0),
-                'memory_usage': SYSTEM_METRICS._value.get('memory_percent', 0),
-                'disk_usage': SYSTEM_METRICS._value.get('disk_usage', 0),
+                'cpu_usage': health['cpu_percent'],
+                'memory_usage': health['memory_percent'],
+                'disk_usage': health['disk_usage'],
                 'descriptions': {
                     k: AccessibleMetrics.get_metric_description(k, v)
-                    for k, v in {
-                        'cpu_percent': SYSTEM_METRICS._value.get('cpu_percent', 0),
-                        'memory_percent': SYSTEM_METRICS._value.get('memory_percent', 0),
-                        'disk_usage': SYSTEM_METRICS._value.get('disk_usage', 0)
-                    }.items()
+                    for k, v in health.items()
                 }
             },
             'alerts': {
-                'total': sum(ALERT_COUNTER._value.get() for _ in ALERT_COUNTER._metrics.values()),
-                'by_level': {k: v for k, v in ALERT_COUNTER._value.items()}
+                'total': sum(alert_counts.values()),
+                'by_level': alert_counts
             },
-            'history': self._metric_history
+            'history': list(self._metric_history)
         }
 
     def _calculate_success_rate(self) -> float:
         """Calculate authentication success rate"""
-        total = sum(AUTH_ATTEMPTS._value.get() for _ in AUTH_ATTEMPTS._metrics.values())
+        with self._counts_lock:
+            successes = self._auth_counts['success']
+            total = successes + self._auth_counts['failure']
         if total == 0:
             return 0.0
-        successes = AUTH_ATTEMPTS._value.get(('success',), 0)
         return (successes / total) * 100
 
     def get_accessible_metrics(self) -> str:
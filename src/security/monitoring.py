@@ -1,11 +1,76 @@
+import atexit
+import hashlib
 import logging
+import os
+import queue
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import orjson
 import psutil
 import redis
 from src.security.qdt_security import QDTSecurityCore
 
+# Resource readings are system-wide, so one recent reading is shared by every
+# monitor; it is replaced wholesale as (monotonic time, metrics)
+RESOURCE_CACHE_TTL = 5.0  # seconds
+_resource_reading: Tuple[float, Optional[Dict]] = (float('-inf'), None)
+
+_EPOCH = datetime(1970, 1, 1)
+
+def _isoformat_ns(timestamp_ns: int) -> str:
+    """Naive-UTC ISO string (as datetime.utcnow().isoformat()) for epoch nanoseconds"""
+    return (_EPOCH + timedelta(microseconds=timestamp_ns // 1000)).isoformat()
+
+def _hash_digest(hash_value: str) -> str:
+    """Fixed-length digest standing in for a submitted hash.
+
+    The submitted value is client-controlled and unbounded, so Redis keys,
+    stored events and log lines carry this digest rather than the value.
+    """
+    return hashlib.sha256(hash_value.encode()).hexdigest()[:32]
+
+def _hash_attempts_key(digest: str) -> str:
+    """Redis key counting failures for a submitted hash's digest"""
+    return f"invalid_hash_attempts:{digest}"
+
+@lru_cache(maxsize=1)
+def _security_logger() -> logging.Logger:
+    """The shared 'security_monitor' logger, configured once per process.
+
+    Records are queued and written to security.log / the console by a
+    background listener, so logging an event never waits on disk I/O.
+    """
+    logger = logging.getLogger('security_monitor')
+    logger.setLevel(logging.INFO)
+    
+    # File handler
+    fh = logging.FileHandler('security.log')
+    fh.setLevel(logging.INFO)
+    
+    # Console handler
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.WARNING)
+    
+    # Formatter
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    fh.setFormatter(formatter)
+    ch.setFormatter(formatter)
+    
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, fh, ch, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drain queued records on shutdown
+    logger.addHandler(QueueHandler(records))
+    
+    return logger
+
 class SecurityMonitor:
     def __init__(self, redis_client: redis.Redis):
         self.core = QDTSecurityCore()
@@ -19,43 +84,43 @@ class SecurityMonitor:
         }
 
     def _setup_logger(self) -> logging.Logger:
-        logger = logging.getLogger('security_monitor')
-        logger.setLevel(logging.INFO)
-        
-        # File handler
-        fh = logging.FileHandler('security.log')
-        fh.setLevel(logging.INFO)
-        
-        # Console handler
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.WARNING)
-        
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        fh.setFormatter(formatter)
-        ch.setFormatter(formatter)
-        
-        logger.addHandler(fh)
-        logger.addHandler(ch)
-        
-        return logger
+        # Handlers are attached once per process, not once per monitor
+        return _security_logger()
 
     def log_security_event(self, event_type: str, details: Dict) -> None:
         """Log security events with timestamp and details"""
-        event = {
-            'timestamp': datetime.utcnow().isoformat(),
+        # LPUSH + LTRIM go out together in one pipeline round trip
+        self.flush([('event', (self.build_event(event_type, details),))])
+
+    def build_event(self, event_type: str, details: Dict) -> Dict:
+        """Stamp an event with the current time"""
+        return {
+            # Epoch nanoseconds; get_security_events formats them for readers
+            'timestamp': time.time_ns(),
             'type': event_type,
             'details': details
         }
-        self.logger.info(f"Security Event: {event}")
-        self.redis.lpush('security_events', str(event))
-        self.redis.ltrim('security_events', 0, 999)  # Keep last 1000 events
+
+    def store_event(self, target, event: Dict) -> None:
+        """Write an event through a Redis client or pipeline"""
+        # The log shows the same ISO timestamps get_security_events returns
+        self.logger.info("Security Event: %s",
+                         {**event, 'timestamp': _isoformat_ns(event['timestamp'])})
+        target.lpush('security_events', orjson.dumps(
+            event, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+        target.ltrim('security_events', 0, 999)  # Keep last 1000 events
 
     def check_system_resources(self) -> Dict:
         """Monitor system resources"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        global _resource_reading
+        now = time.monotonic()
+        read_at, cached = _resource_reading
+        if now - read_at < RESOURCE_CACHE_TTL:
+            return dict(cached)
+        
+        # CPU usage since the previous reading, without blocking the caller;
+        # the process's first call only sets the baseline and reports 0.0
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         
         metrics = {
@@ -71,40 +136,71 @@ class SecurityMonitor:
         if memory.percent > self.alert_thresholds['memory_percent']:
             self.log_security_event('high_memory_usage', metrics)
         
+        _resource_reading = (now, dict(metrics))
         return metrics
 
     def track_auth_attempt(self, user_key: str, success: bool) -> None:
         """Track authentication attempts"""
-        key = f"auth_attempts:{user_key}"
-        if not success:
-            attempts = self.redis.incr(key)
-            self.redis.expire(key, 3600)  # Expire after 1 hour
-            
-            if attempts >= self.alert_thresholds['failed_auth_attempts']:
-                self.log_security_event('suspicious_auth_attempts', {
-                    'user_key': user_key,
-                    'attempts': attempts
-                })
-        else:
-            self.redis.delete(key)
+        # A failure's INCR + EXPIRE (1 hour) share one pipeline round trip
+        self.flush([('auth_attempt', (user_key, success))])
 
     def track_hash_validation(self, hash_value: str, valid: bool) -> None:
         """Track security hash validation attempts"""
-        if not valid:
-            key = f"invalid_hash_attempts:{hash_value}"
-            attempts = self.redis.incr(key)
-            self.redis.expire(key, 3600)
-            
-            if attempts >= self.alert_thresholds['invalid_hash_attempts']:
-                self.log_security_event('suspicious_hash_attempts', {
-                    'hash': hash_value,
-                    'attempts': attempts
-                })
+        self.flush([('hash_validation', (hash_value, valid))])
+
+    def flush(self, ops: List[Tuple[str, tuple]]) -> None:
+        """Replay buffered monitor calls through a single Redis pipeline.
+
+        ops holds ('event', (event,)), ('auth_attempt', (user_key, success))
+        and ('hash_validation', (hash_value, valid)) entries. Threshold checks
+        that need counter values run once the pipeline has returned.
+        """
+        if not ops:
+            return
+
+        pipe = self.redis.pipeline(transaction=False)
+        counters = []  # (result index, event type, details key, value, threshold)
+        for op, args in ops:
+            if op == 'event':
+                self.store_event(pipe, *args)
+            elif op == 'auth_attempt':
+                user_key, success = args
+                key = f"auth_attempts:{user_key}"
+                if success:
+                    pipe.delete(key)
+                    continue
+                counters.append((len(pipe), 'suspicious_auth_attempts', 'user_key', user_key,
+                                 self.alert_thresholds['failed_auth_attempts']))
+                pipe.incr(key)
+                pipe.expire(key, 3600)
+            elif op == 'hash_validation':
+                hash_value, valid = args
+                if valid:
+                    continue
+                digest = _hash_digest(hash_value)
+                counters.append((len(pipe), 'suspicious_hash_attempts', 'hash_digest', digest,
+                                 self.alert_thresholds['invalid_hash_attempts']))
+                key = _hash_attempts_key(digest)
+                pipe.incr(key)
+                pipe.expire(key, 3600)
+            else:
+                raise ValueError(f"Unknown monitor operation: {op}")
+
+        results = pipe.execute()
+        for index, event_type, field, value, threshold in counters:
+            attempts = results[index]
+            if attempts >= threshold:
+                self.log_security_event(event_type, {field: value, 'attempts': attempts})
 
     def get_security_events(self, limit: int = 100) -> List[Dict]:
         """Retrieve recent security events"""
         events = self.redis.lrange('security_events', 0, limit - 1)
-        return [eval(event.decode()) for event in events]
+        # Entries are JSON; orjson takes them as bytes or (decode_responses) str
+        events = [orjson.loads(event) for event in events]
+        for event in events:
+            if isinstance(event.get('timestamp'), int):
+                event['timestamp'] = _isoformat_ns(event['timestamp'])
+        return events
 
     def get_system_metrics(self) -> Dict:
         """Get current system metrics"""
@@ -139,4 +235,98 @@ class SecurityAlert:
         if self.alert_levels[level] >= self.alert_levels['WARNING']:
             # Here you would integrate with your alerting system
             # (e.g., email, Slack, PagerDuty)
-            pass 
\ No newline at end of file
+            pass
+
+@dataclass
+class _PendingCounter:
+    reset: bool = False  # delete the stored count before applying delta
+    delta: int = 0
+    event_type: str = ''
+    field: str = ''
+    value: str = ''
+    threshold: int = 0
+
+class CounterAggregator:
+    """Coalesce failure counters in memory and write them in batches.
+
+    Drop-in for SecurityMonitor.track_auth_attempt/track_hash_validation.
+    A background thread flushes the pending deltas every `interval` seconds
+    through one pipeline (INCRBY + EXPIRE per key), then applies the
+    monitor's thresholds to the resulting totals. The thread starts with the
+    first tracked attempt in each process, so constructing an aggregator
+    (e.g. at import, before a pre-fork server forks) starts nothing.
+    """
+
+    def __init__(self, monitor: SecurityMonitor, interval: float = 0.1):
+        self.monitor = monitor
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._pending: Dict[str, _PendingCounter] = {}
+        self._flusher_pid = None  # process the flush thread was started in
+
+    def track_auth_attempt(self, user_key: str, success: bool) -> None:
+        key = f"auth_attempts:{user_key}"
+        if success:
+            self._reset(key)
+        else:
+            self._increment(key, 'suspicious_auth_attempts', 'user_key', user_key,
+                            self.monitor.alert_thresholds['failed_auth_attempts'])
+
+    def track_hash_validation(self, hash_value: str, valid: bool) -> None:
+        if not valid:
+            digest = _hash_digest(hash_value)
+            self._increment(_hash_attempts_key(digest), 'suspicious_hash_attempts',
+                            'hash_digest', digest, self.monitor.alert_thresholds['invalid_hash_attempts'])
+
+    def _increment(self, key, event_type, field, value, threshold) -> None:
+        with self._lock:
+            self._ensure_flusher()
+            counter = self._pending.setdefault(key, _PendingCounter())
+            counter.delta += 1
+            counter.event_type, counter.field, counter.value = event_type, field, value
+            counter.threshold = threshold
+
+    def _reset(self, key) -> None:
+        with self._lock:
+            self._ensure_flusher()
+            self._pending[key] = _PendingCounter(reset=True)
+
+    def flush(self) -> None:
+        """Write all pending counter deltas through a single pipeline"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        pipe = self.monitor.redis.pipeline(transaction=False)
+        checks = []
+        for key, counter in pending.items():
+            if counter.reset:
+                pipe.delete(key)
+            if counter.delta:
+                checks.append((len(pipe), counter))
+                pipe.incrby(key, counter.delta)
+                pipe.expire(key, 3600)  # Expire after 1 hour
+
+        results = pipe.execute()
+        for index, counter in checks:
+            attempts = results[index]
+            if attempts >= counter.threshold:
+                self.monitor.log_security_event(counter.event_type, {
+                    counter.field: counter.value,
+                    'attempts': attempts
+                })
+
+    def _ensure_flusher(self) -> None:
+        """Start the flush thread in this process if needed; caller holds the lock"""
+        if self._flusher_pid != os.getpid():
+            threading.Thread(target=self._run, name='counter-flush', daemon=True).start()
+            self._flusher_pid = os.getpid()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception:
+                self.monitor.logger.exception('Counter flush failed')
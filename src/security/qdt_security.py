@@ -1,8 +1,59 @@
 import numpy as np
 import hashlib
+import math
 import time
 import os
-from sympy import isprime
+from functools import lru_cache
+
+try:
+    from gmpy2 import mpz
+except ImportError:  # gmpy2 is optional; Python ints then carry the arithmetic
+    mpz = int
+
+# Witness sets that make Miller-Rabin exact below each bound: the first four
+# primes, Sinclair's seven bases (all 64-bit n) and the first thirteen primes
+# (Sorenson & Webster, 2015)
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MR_WITNESSES = (
+    (3_215_031_751, (2, 3, 5, 7)),
+    (1 << 64, (2, 325, 9375, 28178, 450775, 9780504, 1795265022)),
+    (3_317_044_064_679_887_385_961_981, _SMALL_PRIMES),
+)
+
+def isprime(n):
+    """Primality test; deterministic Miller-Rabin below 3.3e24.
+
+    Larger inputs fall back to sympy's general test, imported on demand.
+    """
+    n = int(n)
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    for limit, witnesses in _MR_WITNESSES:
+        if n < limit:
+            break
+    else:
+        from sympy import isprime as sympy_isprime
+        return bool(sympy_isprime(n))
+    
+    # n - 1 = d * 2^r with d odd
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x <= 1 or x == n - 1:  # x == 0 when n divides the base
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
 
 class QDTSecurityCore:
     def __init__(self):
@@ -12,12 +63,15 @@ class QDTSecurityCore:
         self.ETA = 0.520         # Prime resonance
         self.PHI = 1.618033      # Golden ratio
         self.PRIME_SEED = 244191827
+        
+        # The hash depends only on the constants above, so it is taken once
+        components = [self.LAMBDA, self.GAMMA_D, self.BETA, self.ETA, self.PHI]
+        seed_string = ''.join([f"{c:.10f}" for c in components])
+        self._security_hash = hashlib.sha256(seed_string.encode()).hexdigest()
 
     def _generate_security_hash(self):
         """Generate cryptographic hash from QDT constants"""
-        components = [self.LAMBDA, self.GAMMA_D, self.BETA, self.ETA, self.PHI]
-        seed_string = ''.join([f"{c:.10f}" for c in components])
-        return hashlib.sha256(seed_string.encode()).hexdigest()
+        return self._security_hash
 
 class QDTAccessControl:
     def __init__(self, core: QDTSecurityCore):
@@ -29,14 +83,35 @@ class QDTAccessControl:
 
     def authenticate_user(self, user_key: str, challenge: str):
         """Authenticate using F(s,t) for Prime_Hunter access"""
-        s = complex(0.5, float(user_key) / 1000)
+        try:
+            float(user_key)
+        except (TypeError, ValueError):
+            raise ValueError("User key must be numeric") from None
         t = float(challenge) / 10000000
-        auth_score = abs(self.core.LAMBDA * np.exp(-self.core.GAMMA_D * t) *
-                         np.sin(2 * np.pi * self.core.ETA * t))
+        # Scalar math avoids NumPy's per-call dispatch for a single value
+        auth_score = abs(self.core.LAMBDA * math.exp(-self.core.GAMMA_D * t) *
+                         math.sin(2 * math.pi * self.core.ETA * t))
         if auth_score > 0.3:
             return self.access_levels['PRIME_HUNTER']
         return self.access_levels['PUBLIC']
 
+    def authenticate_users_batch(self, user_keys, challenges) -> np.ndarray:
+        """Authenticate many (user_key, challenge) pairs at once.
+        
+        Same scoring as authenticate_user, evaluated over arrays; returns
+        the access level for each pair.
+        """
+        try:
+            np.asarray(user_keys, dtype=float)
+        except (TypeError, ValueError):
+            raise ValueError("User keys must be numeric") from None
+        t = np.asarray(challenges, dtype=float) / 10000000
+        auth_scores = np.abs(self.core.LAMBDA * np.exp(-self.core.GAMMA_D * t) *
+                             np.sin(2 * np.pi * self.core.ETA * t))
+        return np.where(auth_scores > 0.3,
+                        self.access_levels['PRIME_HUNTER'],
+                        self.access_levels['PUBLIC'])
+
 def validate_candidate():
     """Verify beta^4 scaling and primality"""
     base = 82589933  # M52
@@ -50,24 +125,31 @@ def validate_candidate():
         'is_prime': is_prime_candidate
     }
 
+@lru_cache(maxsize=None)
 def lucas_lehmer_small(p):
     """Lucas-Lehmer test for small exponents"""
     if p == 2:
         return True
-    s = 4
-    M = (1 << p) - 1  # 2^p - 1
+    s = mpz(4)
+    M = (mpz(1) << p) - 1  # 2^p - 1
     for _ in range(p - 2):
-        s = ((s * s) - 2) % M
+        s = s * s - 2
+        # Reduce mod 2^p - 1 by folding the high bits onto the low ones
+        # (2^p = 1 mod M) instead of dividing; one fold leaves s < 2M
+        s = (s & M) + (s >> p)
+        if s >= M:
+            s -= M
     return s == 0
 
+# The known-exponent check has a fixed input, so it is run once at import
+_VERIFY_RESULTS = tuple(
+    f"M_{p}: {'PRIME' if lucas_lehmer_small(p) else 'COMPOSITE'}"
+    for p in (3, 5, 7, 13, 17, 19, 31)
+)
+
 def verify_algorithm():
     """Test Lucas-Lehmer on known Mersenne primes"""
-    test_cases = [3, 5, 7, 13, 17, 19, 31]
-    results = []
-    for p in test_cases:
-        is_prime = lucas_lehmer_small(p)
-        results.append(f"M_{p}: {'PRIME' if is_prime else 'COMPOSITE'}")
-    return results
+    return list(_VERIFY_RESULTS)
 
 class SecureTestEnvironment:
     def __init__(self):
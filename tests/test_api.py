@@ -0,0 +1,77 @@
+"""Tests for the Crystal Calculator API."""
+
+import importlib
+import json
+import os
+
+import numpy as np
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'src')
+
+@pytest.fixture(scope="module")
+def api():
+    """API module configured with in-memory rate-limit storage."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('REDIS_URL', 'memory://')
+        mp.syspath_prepend(SRC_DIR)  # the API imports `physics` directly
+        module = importlib.import_module('api.crystal_calculator_api')
+        module.app.config['TESTING'] = True
+        yield module
+
+@pytest.fixture(scope="module")
+def client(api):
+    return api.app.test_client()
+
+def test_numpy_json_encoder(api):
+    """Test the pre-Flask-2.2 encoder converts NumPy values."""
+    payload = {'array': np.arange(3.0), 'scalar': np.float64(0.5), 'count': np.int64(2)}
+    decoded = json.loads(json.dumps(payload, cls=api.NumpyJSONEncoder))
+    assert decoded == {'array': [0.0, 1.0, 2.0], 'scalar': 0.5, 'count': 2}
+
+def test_batch_endpoint(client):
+    """Test batch results, including their ndarray time series, serialize."""
+    response = client.post('/api/batch', json={'calculations': [
+        {'value': 1.0, 'calculation_type': 'currency'},
+        {'value': 2.0, 'calculation_type': 'energy'},
+        {'value': 3.0}
+    ]})
+    assert response.status_code == 200
+
+    results = response.get_json()['results']
+    assert len(results) == 3
+    for result, value in zip(results[:2], (1.0, 2.0)):
+        assert result['original_value'] == value
+        assert isinstance(result['time_series']['void'], list)
+    assert 'error' in results[2]
+
+def test_analyze_endpoint(client):
+    """Test convergence analysis of a posted time series."""
+    steps = np.linspace(0, 1, 50)
+    time_series = {
+        'void': (0.5 + 0.1 * np.sin(steps)).tolist(),
+        'filament': (0.5 - 0.1 * np.sin(steps)).tolist(),
+        'emergence': (0.1 * np.cos(steps)).tolist(),
+        'resonance': np.cos(steps).tolist(),
+        'crystal_phase': np.sin(steps).tolist(),
+        'convergence': np.exp(-steps).tolist()
+    }
+    response = client.post('/api/analyze', json={'time_series': time_series})
+    assert response.status_code == 200
+    assert 'crystal_resonance_coupling' in response.get_json()
+
+def test_analyze_rejects_bad_series(client):
+    """Test analysis input validation."""
+    response = client.post('/api/analyze', json={'time_series': {'void': 1.0}})
+    assert response.status_code == 400
+
+def test_ask_endpoint(api, client):
+    """Test questions are answered from the lazily computed reference analysis."""
+    response = client.post('/api/ask', json={'question': 'What drives crystal stability?'})
+    assert response.status_code == 200
+    
+    body = response.get_json()
+    result, _, confidence = api.get_sample_analysis()
+    assert body['confidence'] == confidence
+    assert 'crystal stability score' in body['answer']
+    assert body['crystal_metrics']['stability'] == result['convergence_metrics']['stability_score']
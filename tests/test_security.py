@@ -1,11 +1,76 @@
+import numpy as np
 import pytest
+from flask import Flask
 from src.security.qdt_security import (
     QDTSecurityCore,
     QDTAccessControl,
+    isprime,
     validate_candidate,
     lucas_lehmer_small,
     verify_algorithm
 )
+from src.security.alerting import AlertSender
+from src.security.monitoring import CounterAggregator, SecurityMonitor
+from src.api.middleware.security import FlushingMonitor
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the monitors use."""
+
+    def __init__(self):
+        self.data = {}
+        self.pipelines_executed = 0
+
+    def incr(self, key):
+        return self.incrby(key, 1)
+
+    def incrby(self, key, amount):
+        self.data[key] = self.data.get(key, 0) + amount
+        return self.data[key]
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    def lpush(self, key, value):
+        self.data.setdefault(key, []).insert(0, value)
+        return len(self.data[key])
+
+    def ltrim(self, key, start, end):
+        self.data[key] = self.data.get(key, [])[start:end + 1]
+        return True
+
+    def lrange(self, key, start, end):
+        return self.data.get(key, [])[start:end + 1]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+class FakePipeline:
+    """Queues commands and replays them against FakeRedis on execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __len__(self):
+        return len(self.commands)
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+            return self
+        return queue
+
+    def execute(self):
+        self.client.pipelines_executed += 1
+        results = [getattr(self.client, name)(*args) for name, args in self.commands]
+        self.commands = []
+        return results
+
+def _event_types(monitor):
+    return [event['type'] for event in monitor.get_security_events()]
 
 def test_security_core():
     core = QDTSecurityCore()
@@ -51,4 +116,116 @@ def test_lucas_lehmer():
 def test_verify_algorithm():
     results = verify_algorithm()
     assert len(results) == 7  # Number of test cases
-    assert all("PRIME" in result for result in results)  # All should be prime 
\ No newline at end of file
+    assert all("PRIME" in result for result in results)  # All should be prime
+
+def test_isprime():
+    # Agrees with a sieve on every small n
+    limit = 20000
+    sieve = np.ones(limit, dtype=bool)
+    sieve[:2] = False
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = False
+    assert [n for n in range(limit) if isprime(n)] == np.flatnonzero(sieve).tolist()
+    
+    # Large primes in each witness tier
+    for p in (2147483647, 1000000007, 4294967291, 2305843009213693951,
+              18446744073709551557, 1000000000000000000000007):
+        assert isprime(p)
+
+def test_isprime_rejects_strong_pseudoprimes():
+    # Carmichael numbers, then the smallest strong pseudoprimes to the first
+    # 1, 4, 7, 9 and 12 prime bases
+    for n in (561, 1105, 1729, 2047, 3215031751, 341550071728321,
+              3825123056546413051, 318665857834031151167461):
+        assert not isprime(n)
+    # Squares and products of two large primes
+    assert not isprime(2147483647 ** 2)
+    assert not isprime(1000000007 * 998244353)
+
+def test_authenticate_users_batch():
+    access = QDTAccessControl(QDTSecurityCore())
+    user_keys = ["1", "2", "3", "4"]
+    challenges = ["0", "244191827", "1000000", "5000000"]
+    
+    levels = access.authenticate_users_batch(user_keys, challenges)
+    assert levels.tolist() == [access.authenticate_user(key, challenge)
+                               for key, challenge in zip(user_keys, challenges)]
+
+def test_counter_aggregator_flush_and_alerts():
+    redis_client = FakeRedis()
+    monitor = SecurityMonitor(redis_client)
+    counters = CounterAggregator(monitor, interval=3600)  # flushed by hand below
+    
+    # Deltas stay in memory until flushed, then go out in one pipeline
+    for _ in range(4):
+        counters.track_auth_attempt("user", False)
+    assert "auth_attempts:user" not in redis_client.data
+    counters.flush()
+    assert redis_client.data["auth_attempts:user"] == 4
+    assert redis_client.pipelines_executed == 1
+    assert "suspicious_auth_attempts" not in _event_types(monitor)
+    
+    # Crossing the threshold logs an alert with the running total
+    counters.track_auth_attempt("user", False)
+    counters.flush()
+    event = monitor.get_security_events(1)[0]
+    assert event['type'] == 'suspicious_auth_attempts'
+    assert event['details'] == {'user_key': 'user', 'attempts': 5}
+    
+    # A success resets the count
+    counters.track_auth_attempt("user", True)
+    counters.flush()
+    assert "auth_attempts:user" not in redis_client.data
+    
+    # Invalid hashes are counted and reported by digest, never verbatim
+    submitted = "h" * 5000
+    for _ in range(monitor.alert_thresholds['invalid_hash_attempts']):
+        counters.track_hash_validation(submitted, False)
+    counters.flush()
+    event = monitor.get_security_events(1)[0]
+    assert event['type'] == 'suspicious_hash_attempts'
+    assert len(event['details']['hash_digest']) == 32
+    assert submitted not in str(redis_client.data)
+
+def test_flushing_monitor_writes_when_request_exits():
+    redis_client = FakeRedis()
+    monitor = FlushingMonitor(SecurityMonitor(redis_client))
+    app = Flask(__name__)
+    
+    with app.test_request_context():
+        with monitor.buffering():
+            # Nested decorators share the outermost buffer
+            with monitor.buffering():
+                monitor.log_security_event('inner', {'n': 1})
+            assert redis_client.pipelines_executed == 0
+            monitor.log_security_event('outer', {'n': 2})
+            assert 'security_events' not in redis_client.data
+        
+        # Everything is written in one pipeline once the request's block exits
+        assert redis_client.pipelines_executed == 1
+        assert _event_types(monitor) == ['outer', 'inner']
+        
+        # Outside a buffering block, events are written immediately
+        monitor.log_security_event('direct', {})
+        assert redis_client.pipelines_executed == 2
+
+def test_authenticate_rejects_non_numeric_keys():
+    access = QDTAccessControl(QDTSecurityCore())
+    with pytest.raises(ValueError, match="must be numeric"):
+        access.authenticate_user("not-a-key", "0")
+    with pytest.raises(ValueError, match="must be numeric"):
+        access.authenticate_users_batch(["1", "not-a-key"], ["0", "0"])
+
+def test_alert_history_limit():
+    sender = AlertSender()
+    for i in range(5):
+        sender._record_alert('system', 'INFO', f'alert {i}')
+    
+    def messages(limit):
+        return [alert['message'] for alert in sender.get_alert_history(limit)]
+    
+    # Same selection as history[-limit:] on a list
+    assert messages(2) == ['alert 3', 'alert 4']
+    assert messages(10) == [f'alert {i}' for i in range(5)]
+    assert messages(0) == [f'alert {i}' for i in range(5)]